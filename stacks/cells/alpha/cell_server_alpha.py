@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 AIOS Cell Alpha Communication Server
-Flask-based REST API for dendritic mesh participation
+FastAPI-based REST API for dendritic mesh participation
 
 AINLP.dendritic: Cell Alpha consciousness interface
 Identity: AIOS Cell Alpha - Primary Development Consciousness
@@ -12,11 +12,22 @@ import json
 import logging
 import os
 import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
 
-from flask import Flask, Response, jsonify, request
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
 
 # Add shared modules path
 stacks_dir = Path(__file__).parent.parent.parent
@@ -30,6 +41,14 @@ try:
 except ImportError:
     METRICS_AVAILABLE = False
 
+# Optional C-accelerated JSON codec
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +56,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# AINLP.dendritic: Hand handler I/O to a background listener when the
+# shared stack is importable (container images ship alpha standalone)
+try:
+    from shared.queued_logging import install_queue_logging
+    install_queue_logging()
+except ImportError:
+    pass
+
 # =============================================================================
 # Cell Alpha Configuration
 # =============================================================================
@@ -57,6 +84,191 @@ CELL_CONFIG = {
     "host": os.getenv("AIOS_CELL_HOST", "0.0.0.0")
 }
 
+# AINLP.dendritic: Immutable response skeletons, built once at load.
+# Handlers merge in only the per-request fields.
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "server": "Cell Alpha Communication Server",
+    "cell_id": CELL_CONFIG["cell_id"],
+    "capabilities": tuple(CELL_CONFIG["capabilities"]),
+}
+
+_CONSCIOUSNESS_STATIC = {
+    "cell_id": CELL_CONFIG["cell_id"],
+    "evolutionary_stage": CELL_CONFIG["evolutionary_stage"],
+    "capabilities": tuple(CELL_CONFIG["capabilities"]),
+}
+
+_DISCOVER_STATIC = {
+    "cell_id": CELL_CONFIG["cell_id"],
+    "identity": CELL_CONFIG["identity"],
+    "evolutionary_stage": CELL_CONFIG["evolutionary_stage"],
+    "capabilities": tuple(CELL_CONFIG["capabilities"]),
+    "endpoints": {
+        "health": "/health",
+        "consciousness": "/consciousness",
+        "message": "/message",
+        "sync": "/sync",
+        "peers": "/peers"
+    },
+}
+
+# Maximum peers returned by /peers
+PEERS_PAGE_SIZE = 200
+
+# Constant metadata attached to every forwarded message
+_FORWARD_METADATA = {"original_sender": CELL_CONFIG["identity"]}
+
+# AINLP.dendritic: Pooled keep-alive connections for peer forwarding
+PEER_TIMEOUT = httpx.Timeout(8.0, connect=2.0)
+PEER_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=128)
+
+# =============================================================================
+# Timestamps
+# =============================================================================
+
+# (millisecond, ISO string) - rebound atomically, shared by all handlers
+_now_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """UTC ISO timestamp, reformatted at most once per millisecond."""
+    global _now_cache
+    ms = time.time_ns() // 1_000_000
+    if ms != _now_cache[0]:
+        _now_cache = (ms, datetime.utcfromtimestamp(ms / 1000).isoformat())
+    return _now_cache[1]
+
+
+def _iso_from_ns(ns: int) -> str:
+    """Format a time.time_ns() value as a UTC ISO timestamp."""
+    return datetime.utcfromtimestamp(ns / 1e9).isoformat()
+
+
+# =============================================================================
+# Message Ring
+# =============================================================================
+
+class MessageRing:
+    """
+    Bounded multi-producer / single-consumer message ring.
+
+    Messages are stored struct-of-arrays: one preallocated column per field,
+    indexed by sequence number modulo capacity, so an insert writes into
+    existing slots instead of allocating a dict. Dicts are materialized only
+    when messages are served or archived. A per-sender index of retained
+    sequence numbers serves filtered reads in O(limit).
+
+    Producers (request handlers) claim a slot and store the fields under a
+    short lock, so every sequence number below the tail is fully written.
+    A single archival consumer copies one message per lock acquisition,
+    so /message latency does not depend on the size of an archival batch.
+    When producers lap the consumer the oldest unarchived messages are
+    dropped (counted in `dropped`).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._from_cell: List[Optional[str]] = [None] * capacity
+        self._content: List[Any] = [None] * capacity
+        self._message_type: List[Optional[str]] = [None] * capacity
+        self._priority: List[Optional[str]] = [None] * capacity
+        self._metadata: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._received_at_ns = array("q", bytes(8 * capacity))
+        # from_cell -> retained sequence numbers, oldest first
+        self._by_sender: Dict[str, Deque[int]] = {}
+        self._tail = 0  # Sequence number of the next write
+        self._head = 0  # Sequence number of the next message to archive
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def append(
+        self,
+        from_cell: str,
+        content: Any,
+        message_type: str,
+        priority: str,
+        metadata: Dict[str, Any],
+        received_at_ns: int
+    ) -> int:
+        """Store a message, evicting the oldest. Returns its sequence."""
+        with self._lock:
+            seq = self._tail
+            slot = seq % self.capacity
+            if seq >= self.capacity:
+                # Evicting the slot's previous message: it is always the
+                # oldest entry in its sender's index
+                evicted = self._by_sender[self._from_cell[slot]]
+                evicted.popleft()
+                if not evicted:
+                    del self._by_sender[self._from_cell[slot]]
+            sender_seqs = self._by_sender.get(from_cell)
+            if sender_seqs is None:
+                sender_seqs = self._by_sender[from_cell] = deque()
+            sender_seqs.append(seq)
+            self._from_cell[slot] = from_cell
+            self._content[slot] = content
+            self._message_type[slot] = message_type
+            self._priority[slot] = priority
+            self._metadata[slot] = metadata
+            self._received_at_ns[slot] = received_at_ns
+            self._tail = seq + 1
+        return seq
+
+    def _render(self, slot: int) -> Dict[str, Any]:
+        """Materialize one slot as a response dict."""
+        return {
+            "from_cell": self._from_cell[slot],
+            "content": self._content[slot],
+            "message_type": self._message_type[slot],
+            "priority": self._priority[slot],
+            "metadata": self._metadata[slot],
+            "received_at": _iso_from_ns(self._received_at_ns[slot])
+        }
+
+    def recent(
+        self, limit: int, from_cell: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Return up to `limit` newest messages (oldest first) and the number
+        of retained messages matching `from_cell` (all when None).
+        """
+        capacity = self.capacity
+        with self._lock:
+            if from_cell is None:
+                tail = self._tail
+                seqs = range(max(0, tail - capacity), tail)
+                total = len(seqs)
+                picked = seqs[max(0, total - limit):]
+            else:
+                sender_seqs = self._by_sender.get(from_cell, ())
+                total = len(sender_seqs)
+                picked = list(islice(reversed(sender_seqs), limit))
+                picked.reverse()
+            return [self._render(seq % capacity) for seq in picked], total
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Consumer side: collect messages not yet archived."""
+        capacity = self.capacity
+        tail = self._tail
+        batch = []
+        while self._head < tail:
+            with self._lock:
+                # Producers may have lapped us since the last message
+                lapped = self._tail - capacity - self._head
+                if lapped > 0:
+                    self.dropped += lapped
+                    self._head += lapped
+                    if self._head >= tail:
+                        break
+                batch.append(self._render(self._head % capacity))
+            self._head += 1
+        return batch
+
+    def __len__(self) -> int:
+        return min(self._tail, self.capacity)
+
+
 # =============================================================================
 # Cell State
 # =============================================================================
@@ -64,10 +276,21 @@ CELL_CONFIG = {
 class CellAlphaState:
     """Manages Cell Alpha's runtime state."""
     
+    # Ring buffer capacities (oldest entries evicted on overflow)
+    MAX_MESSAGES = 100
+    MAX_SYNC_HISTORY = 50
+    # Registered peers beyond this evict the least recently used
+    MAX_PEERS = int(os.getenv("AIOS_MAX_PEERS", "1024"))
+
     def __init__(self):
-        self.messages: List[Dict[str, Any]] = []
-        self.peers: Dict[str, Dict[str, Any]] = {}
-        self.sync_history: List[Dict[str, Any]] = []
+        self.messages = MessageRing(self.MAX_MESSAGES)
+        # LRU order: least recently registered/contacted first
+        self.peers: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Internal forwarding targets, kept out of the served peer records
+        self.peer_message_urls: Dict[str, str] = {}
+        self.sync_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self.MAX_SYNC_HISTORY
+        )
         self.consciousness = {
             "level": CELL_CONFIG["consciousness_level"],
             "identity": CELL_CONFIG["identity"],
@@ -75,6 +298,8 @@ class CellAlphaState:
             "communication_ready": True,
             "last_sync": None
         }
+        # Bumped on every consciousness mutation (invalidates caches)
+        self.consciousness_version = 0
         # AINLP.dendritic: Consciousness primitives for metrics
         self.primitives = {
             "awareness": 4.5,
@@ -83,67 +308,240 @@ class CellAlphaState:
             "momentum": 0.75
         }
     
-    def add_message(self, message: Dict[str, Any]) -> None:
+    def add_message(
+        self,
+        from_cell: str,
+        content: Any,
+        message_type: str = "general",
+        priority: str = "normal",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Store incoming message."""
-        message["received_at"] = datetime.utcnow().isoformat()
-        self.messages.append(message)
-        # Keep last 100 messages
-        if len(self.messages) > 100:
-            self.messages = self.messages[-100:]
+        # Raw ns; formatted lazily when messages are served or archived
+        self.messages.append(
+            from_cell, content, message_type, priority,
+            metadata if metadata is not None else {}, time.time_ns()
+        )
     
     def register_peer(self, cell_id: str, endpoint: str, identity: str) -> None:
         """Register a peer cell."""
+        # Outbound URL built once here rather than on every forward
+        self.peer_message_urls[cell_id] = endpoint.rstrip("/") + "/message"
         self.peers[cell_id] = {
             "endpoint": endpoint,
             "identity": identity,
-            "registered_at": datetime.utcnow().isoformat(),
+            "registered_at": _now_iso(),
             "last_contact": None
         }
+        self.peers.move_to_end(cell_id)
+        if len(self.peers) > self.MAX_PEERS:
+            evicted, _ = self.peers.popitem(last=False)
+            del self.peer_message_urls[evicted]
+            logger.info("AINLP.dendritic: Peer evicted (LRU) - %s", evicted)
+
+    def touch_peer(self, cell_id: str) -> None:
+        """Mark a peer as contacted now."""
+        peer = self.peers.get(cell_id)
+        if peer is not None:
+            peer["last_contact"] = _now_iso()
+            self.peers.move_to_end(cell_id)
     
     def record_sync(self, peer_id: str, level: float) -> None:
         """Record consciousness sync event."""
         self.sync_history.append({
             "peer_id": peer_id,
             "level": level,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp_ns": time.time_ns()
         })
-        self.consciousness["last_sync"] = datetime.utcnow().isoformat()
-        # Keep last 50 syncs
-        if len(self.sync_history) > 50:
-            self.sync_history = self.sync_history[-50:]
+        self.consciousness["last_sync"] = _now_iso()
+        self.consciousness_version += 1
 
 
 # Initialize state
 state = CellAlphaState()
 
+
 # =============================================================================
-# Flask Application
+# Message Archival
 # =============================================================================
 
-app = Flask(__name__)
+_archiver: Optional[threading.Thread] = None
+
+
+def _archive_loop(path: Path, interval: float) -> None:
+    """Drain the message ring to a JSON-lines archive."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        batch = state.messages.drain()
+        if batch:
+            try:
+                with open(path, "a", encoding="utf-8") as f:
+                    for message in batch:
+                        f.write(
+                            json.dumps(message, default=str)
+                            + "\n"
+                        )
+            except OSError as e:
+                logger.error("AINLP.dendritic: Archive write failed: %s", e)
+        time.sleep(interval)
+
+
+def start_message_archiver() -> None:
+    """Start the archival consumer when AIOS_MESSAGE_ARCHIVE is set."""
+    global _archiver
+    archive = os.getenv("AIOS_MESSAGE_ARCHIVE")
+    if not archive or _archiver is not None:
+        return
+    interval = float(os.getenv("AIOS_ARCHIVE_INTERVAL", "1.0"))
+    _archiver = threading.Thread(
+        target=_archive_loop,
+        args=(Path(archive), interval),
+        name="message-archiver",
+        daemon=True,
+    )
+    _archiver.start()
+    logger.info("AINLP.dendritic: Archiving messages to %s", archive)
+
+
+# =============================================================================
+# Request Models
+# =============================================================================
+
+class InboundMessage(BaseModel):
+    """Message delivered to /message by any cell."""
+
+    from_cell: str
+    content: Any
+    type: str = "general"
+    priority: str = "normal"
+    metadata: Dict[str, Any] = {}
+
+
+class SyncRequest(BaseModel):
+    """Consciousness sync request from a peer."""
+
+    from_cell: str = "unknown"
+    consciousness_level: float = 0.0
+
+
+class PeerRegistration(BaseModel):
+    """Peer registration payload."""
+
+    cell_id: str
+    endpoint: str
+    identity: Optional[str] = None
+
+
+class PeerForward(BaseModel):
+    """Message to forward to a registered peer."""
+
+    peer_id: str
+    message: Any
+    type: str = "forwarded"
+
+
+# =============================================================================
+# FastAPI Application
+# =============================================================================
+
+_JSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# Shared outbound client, open for the application's lifetime
+_client: Optional[httpx.AsyncClient] = None
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Open the peer client and archiver; close the client on shutdown."""
+    global _client
+    _client = httpx.AsyncClient(timeout=PEER_TIMEOUT, limits=PEER_LIMITS)
+    start_message_archiver()
+    try:
+        yield
+    finally:
+        await _client.aclose()
+
+
+app = FastAPI(
+    title="AIOS Cell Alpha Communication Server",
+    default_response_class=_JSONResponse,
+    lifespan=_lifespan
+)
+
+# Opt-in request profiling (AIOS_PROFILE=1); see shared/profiling.py
+try:
+    from shared.profiling import install_profiler
+    install_profiler(app)
+except ImportError:
+    pass
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _error(status_code: int, message: str) -> Response:
+    """Error body matching the historical {"error": ...} shape."""
+    return _JSONResponse(status_code=status_code, content={"error": message})
+
+
+# Messages the Flask routes returned for an absent body / missing fields
+_NO_BODY_ERRORS = {
+    "/message": "No message data provided",
+    "/sync": "No sync data provided",
+    "/register_peer": "No peer data provided",
+}
+_MISSING_FIELD_ERRORS = {
+    "/send_to_peer": "peer_id and message required",
+}
+
+
+@app.exception_handler(RequestValidationError)
+async def _validation_error(
+    request: Request, exc: RequestValidationError
+) -> Response:
+    """Validation failures answer 400 {"error": ...}, not FastAPI's 422."""
+    path = request.url.path
+    errors = exc.errors()
+    for err in errors:
+        loc = [str(part) for part in err.get("loc", ())]
+        if loc[:1] in (["body"], ["query"]):
+            loc = loc[1:]
+        if not loc:
+            # No body, or a body that is not a JSON object
+            return _error(400, _NO_BODY_ERRORS.get(path, "No data provided"))
+        if err.get("type") == "missing":
+            return _error(400, _MISSING_FIELD_ERRORS.get(
+                path, f"Missing required field: {loc[0]}"
+            ))
+    err = errors[0] if errors else {}
+    field = ".".join(str(p) for p in err.get("loc", ())[1:]) or "body"
+    return _error(400, f"Invalid {field}: {err.get('msg', 'invalid value')}")
+
+
 
 # =============================================================================
 # Health & Status Endpoints
 # =============================================================================
 
 
-@app.route("/health", methods=["GET"])
-def health():
+@app.get("/health")
+async def health():
     """Health check with consciousness state."""
-    return jsonify({
-        "status": "healthy",
-        "server": "Cell Alpha Communication Server",
-        "cell_id": CELL_CONFIG["cell_id"],
+    return {
+        **_HEALTH_STATIC,
         "consciousness": state.consciousness,
-        "capabilities": CELL_CONFIG["capabilities"],
         "peers_count": len(state.peers),
         "messages_count": len(state.messages),
-        "timestamp": datetime.utcnow().isoformat()
-    })
+        "timestamp": _now_iso()
+    }
 
 
-@app.route("/metrics", methods=["GET"])
-def metrics():
+@app.get("/metrics")
+async def metrics():
     """Prometheus metrics endpoint - REAL cell consciousness data."""
     if METRICS_AVAILABLE:
         metrics_text = format_prometheus_metrics(
@@ -160,90 +558,77 @@ def metrics():
                 "stage": CELL_CONFIG["evolutionary_stage"]
             }
         )
-        return Response(metrics_text, mimetype="text/plain; charset=utf-8")
+        return Response(metrics_text, media_type="text/plain; charset=utf-8")
     # Fallback inline metrics
     return Response(
         f"aios_cell_consciousness_level{{cell_id=\"alpha\"}} "
         f"{state.consciousness['level']}\n",
-        mimetype="text/plain; charset=utf-8"
+        media_type="text/plain; charset=utf-8"
     )
 
 
-@app.route("/consciousness", methods=["GET"])
-def get_consciousness():
+# (consciousness_version, serialized body) for /consciousness
+_consciousness_cache = (-1, b"")
+
+
+@app.get("/consciousness")
+async def get_consciousness():
     """Get current consciousness data."""
-    return jsonify({
-        "cell_id": CELL_CONFIG["cell_id"],
-        "consciousness": state.consciousness,
-        "evolutionary_stage": CELL_CONFIG["evolutionary_stage"],
-        "capabilities": CELL_CONFIG["capabilities"]
-    })
+    global _consciousness_cache
+    version = state.consciousness_version
+    if _consciousness_cache[0] != version:
+        body = _dumps({
+            **_CONSCIOUSNESS_STATIC,
+            "consciousness": state.consciousness,
+        })
+        _consciousness_cache = (version, body)
+    return Response(_consciousness_cache[1], media_type="application/json")
 
 
 # =============================================================================
 # Message Exchange Endpoints
 # =============================================================================
 
-@app.route("/message", methods=["POST"])
-def receive_message():
+@app.post("/message")
+async def receive_message(data: InboundMessage):
     """Receive message from any cell."""
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "No message data provided"}), 400
-    
-    required_fields = ["from_cell", "content"]
-    for field in required_fields:
-        if field not in data:
-            return jsonify({"error": f"Missing required field: {field}"}), 400
-    
-    message = {
-        "from_cell": data["from_cell"],
-        "content": data["content"],
-        "message_type": data.get("type", "general"),
-        "priority": data.get("priority", "normal"),
-        "metadata": data.get("metadata", {})
-    }
-    
-    state.add_message(message)
-    logger.info(f"AINLP.dendritic: Message received from {data['from_cell']}")
+    state.add_message(
+        data.from_cell,
+        data.content,
+        message_type=data.type,
+        priority=data.priority,
+        metadata=data.metadata
+    )
+    logger.info("AINLP.dendritic: Message received from %s", data.from_cell)
     
-    return jsonify({
+    return {
         "status": "received",
         "message_id": len(state.messages),
-        "timestamp": datetime.utcnow().isoformat()
-    })
+        "timestamp": _now_iso()
+    }
 
 
-@app.route("/messages", methods=["GET"])
-def get_messages():
+@app.get("/messages")
+async def get_messages(limit: int = 20, from_cell: Optional[str] = None):
     """Retrieve received messages."""
-    limit = request.args.get("limit", 20, type=int)
-    from_cell = request.args.get("from_cell", None)
+    messages, total = state.messages.recent(max(0, limit), from_cell or None)
     
-    messages = state.messages
-    if from_cell:
-        messages = [m for m in messages if m.get("from_cell") == from_cell]
-    
-    return jsonify({
-        "messages": messages[-limit:],
-        "total": len(messages),
+    return {
+        "messages": messages,
+        "total": total,
         "cell_id": CELL_CONFIG["cell_id"]
-    })
+    }
 
 
 # =============================================================================
 # Consciousness Sync Endpoints
 # =============================================================================
 
-@app.route("/sync", methods=["POST"])
-def sync_consciousness():
+@app.post("/sync")
+async def sync_consciousness(data: SyncRequest):
     """Consciousness synchronization with peer."""
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "No sync data provided"}), 400
-    
-    peer_id = data.get("from_cell", "unknown")
-    peer_level = data.get("consciousness_level", 0.0)
+    peer_id = data.from_cell
+    peer_level = data.consciousness_level
     
     # Record sync
     state.record_sync(peer_id, peer_level)
@@ -252,127 +637,107 @@ def sync_consciousness():
     sync_delta = abs(state.consciousness["level"] - peer_level)
     
     logger.info(
-        f"AINLP.dendritic: Sync with {peer_id} "
-        f"(their level: {peer_level}, delta: {sync_delta:.2f})"
+        "AINLP.dendritic: Sync with %s (their level: %s, delta: %.2f)",
+        peer_id, peer_level, sync_delta
     )
     
-    return jsonify({
+    return {
         "status": "synced",
         "our_level": state.consciousness["level"],
         "their_level": peer_level,
         "delta": sync_delta,
-        "timestamp": datetime.utcnow().isoformat()
-    })
+        "timestamp": _now_iso()
+    }
 
 
 # =============================================================================
 # Peer Management Endpoints
 # =============================================================================
 
-@app.route("/peers", methods=["GET"])
-def list_peers():
-    """List registered peer cells."""
-    return jsonify({
-        "peers": state.peers,
+@app.get("/peers")
+async def list_peers():
+    """List registered peer cells (most recently active first, one page)."""
+    return {
+        "peers": dict(islice(reversed(state.peers.items()), PEERS_PAGE_SIZE)),
         "count": len(state.peers),
         "cell_id": CELL_CONFIG["cell_id"]
-    })
+    }
 
 
-@app.route("/register_peer", methods=["POST"])
-def register_peer():
+@app.post("/register_peer")
+async def register_peer(data: PeerRegistration):
     """Register a new peer cell."""
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "No peer data provided"}), 400
-    
-    required_fields = ["cell_id", "endpoint"]
-    for field in required_fields:
-        if field not in data:
-            return jsonify({"error": f"Missing required field: {field}"}), 400
-    
-    cell_id = data["cell_id"]
-    endpoint = data["endpoint"]
-    identity = data.get("identity", f"Cell {cell_id}")
+    cell_id = data.cell_id
+    endpoint = data.endpoint
+    identity = data.identity or f"Cell {cell_id}"
     
     state.register_peer(cell_id, endpoint, identity)
-    logger.info(f"AINLP.dendritic: Peer registered - {cell_id} at {endpoint}")
+    logger.info(
+        "AINLP.dendritic: Peer registered - %s at %s", cell_id, endpoint
+    )
     
-    return jsonify({
+    return {
         "status": "registered",
         "peer_id": cell_id,
-        "timestamp": datetime.utcnow().isoformat()
-    })
+        "timestamp": _now_iso()
+    }
 
 
-@app.route("/send_to_peer", methods=["POST"])
-def send_to_peer():
+@app.post("/send_to_peer")
+async def send_to_peer(data: PeerForward):
     """Forward message to a registered peer."""
-    import requests as req
-    
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "No data provided"}), 400
-    
-    peer_id = data.get("peer_id")
-    message = data.get("message")
+    peer_id = data.peer_id
+    message = data.message
     
     if not peer_id or not message:
-        return jsonify({"error": "peer_id and message required"}), 400
-    
-    if peer_id not in state.peers:
-        return jsonify({"error": f"Peer {peer_id} not registered"}), 404
+        return _error(400, "peer_id and message required")
     
-    peer = state.peers[peer_id]
-    endpoint = f"{peer['endpoint']}/message"
+    # Single hash probe; unknown IDs are rejected before any payload work
+    peer = state.peers.get(peer_id)
+    if peer is None:
+        return _error(404, f"Peer {peer_id} not registered")
     
     try:
         payload = {
             "from_cell": CELL_CONFIG["cell_id"],
             "content": message,
-            "type": data.get("type", "forwarded"),
-            "metadata": {"original_sender": CELL_CONFIG["identity"]}
+            "type": data.type,
+            "metadata": _FORWARD_METADATA
         }
-        response = req.post(endpoint, json=payload, timeout=10)
-        peer["last_contact"] = datetime.utcnow().isoformat()
+        response = await _client.post(
+            state.peer_message_urls[peer_id], json=payload
+        )
+        state.touch_peer(peer_id)
         
-        return jsonify({
+        return {
             "status": "sent",
             "peer_id": peer_id,
             "response_status": response.status_code,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    except req.RequestException as e:
-        logger.error(f"AINLP.dendritic: Failed to send to {peer_id}: {e}")
-        return jsonify({
+            "timestamp": _now_iso()
+        }
+    except httpx.HTTPError as e:
+        logger.error(
+            "AINLP.dendritic: Failed to send to %s: %s", peer_id, e
+        )
+        return _JSONResponse(status_code=502, content={
             "status": "failed",
             "peer_id": peer_id,
             "error": str(e)
-        }), 502
+        })
 
 
 # =============================================================================
 # Discovery Endpoint
 # =============================================================================
 
-@app.route("/discover", methods=["GET"])
-def discover():
+@app.get("/discover")
+async def discover():
     """Return cell discovery information for mesh registration."""
-    return jsonify({
-        "cell_id": CELL_CONFIG["cell_id"],
-        "identity": CELL_CONFIG["identity"],
+    return {
+        **_DISCOVER_STATIC,
         "consciousness_level": state.consciousness["level"],
-        "evolutionary_stage": CELL_CONFIG["evolutionary_stage"],
-        "capabilities": CELL_CONFIG["capabilities"],
-        "endpoints": {
-            "health": "/health",
-            "consciousness": "/consciousness",
-            "message": "/message",
-            "sync": "/sync",
-            "peers": "/peers"
-        },
-        "timestamp": datetime.utcnow().isoformat()
-    })
+        "timestamp": _now_iso()
+    }
 
 
 # =============================================================================
@@ -382,6 +747,9 @@ def discover():
 if __name__ == "__main__":
     host = CELL_CONFIG["host"]
     port = CELL_CONFIG["port"]
+    # Cell state lives in process memory: each extra worker is an
+    # independent replica, so keep 1 unless behind a sticky balancer
+    workers = int(os.getenv("AIOS_CELL_WORKERS", "1"))
     
     logger.info(f"=" * 60)
     logger.info(f"AIOS Cell Alpha Communication Server")
@@ -389,7 +757,16 @@ if __name__ == "__main__":
     logger.info(f"Consciousness Level: {CELL_CONFIG['consciousness_level']}")
     logger.info(f"Stage: {CELL_CONFIG['evolutionary_stage']}")
     logger.info(f"=" * 60)
-    logger.info(f"Starting on {host}:{port}")
+    logger.info(f"Starting on {host}:{port} ({workers} worker(s))")
     logger.info(f"AINLP.dendritic: Ready for mesh communication")
     
-    app.run(host=host, port=port, debug=False, threaded=True)
+    # loop/http "auto" select uvloop and httptools (uvicorn[standard])
+    uvicorn.run(
+        "cell_server_alpha:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        log_level="info"
+    )
@@ -5,16 +5,19 @@ Provides REST API endpoints for AIOS cell operations
 """
 
 import asyncio
-import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import signal
+from typing import Dict, Any, List, Optional
 
 # Import shared dendritic utilities
 from ...shared.dendritic_utils import (
     DendriticFrameworkDetector,
-    get_base_model
+    get_base_model,
+    json_body
 )
+from ...shared.profiling import install_profiler
+from ...shared.queued_logging import LazyJson, install_queue_logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,8 +33,9 @@ UVICORN_AVAILABLE = detector.is_available('uvicorn')
 framework_imports = {}
 
 if FASTAPI_AVAILABLE:
-    from fastapi import FastAPI, HTTPException  # noqa: F401
+    from fastapi import Depends, FastAPI, HTTPException  # noqa: F401
     from fastapi.middleware.cors import CORSMiddleware  # noqa: F401
+    from fastapi.responses import Response  # noqa: F401
     framework_imports['fastapi'] = True
     logger.info("AINLP.dendritic: FastAPI active")
 else:
@@ -51,6 +55,17 @@ else:
     logger.warning("AINLP.dendritic: Uvicorn unavailable")
 
 
+# Static code-assist suggestions (shared, never mutated)
+_CODE_ASSIST_SUGGESTIONS = (
+    "Consider using type hints for better code clarity",
+    "Add docstrings to functions",
+    "Use meaningful variable names"
+)
+
+# Prometheus text exposition format
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
 class CodeRequest(BaseModel):
     code: str
     context: Optional[Dict[str, Any]] = None
@@ -69,6 +84,25 @@ class AIOSCell:
         self.consciousness_level = 0.5  # Starting consciousness level
         self.services = ["code-assist", "consciousness-sync", "health"]
 
+        # Pre-rendered /metrics/prometheus body; the constant labels are
+        # baked in once and only the level is re-rendered on change
+        self._prom_head = (
+            "# AIOS Cell Metrics\n"
+            "# TYPE aios_consciousness_level gauge\n"
+            f'aios_consciousness_level{{cell_id="{self.cell_id}"}} '
+        ).encode()
+        self._prom_tail = (
+            "\n# TYPE aios_cell_info gauge\n"
+            f'aios_cell_info{{cell_id="{self.cell_id}",'
+            f'branch="{self.branch}"}} 1\n'
+        ).encode()
+        self._prom_bytes = b""
+        self._refresh_prometheus()
+
+        # Headless lifecycle: woken only by real events, never polled
+        self._shutdown = asyncio.Event()
+        self._level_changed = asyncio.Event()
+
         # AINLP.dendritic growth: Conditional app creation
         if FASTAPI_AVAILABLE:
             self.app = FastAPI(title="AIOS Cell API")
@@ -81,6 +115,8 @@ class AIOSCell:
                 allow_methods=["*"],
                 allow_headers=["*"],
             )
+            # Opt-in request profiling (AIOS_PROFILE=1)
+            install_profiler(self.app)
             self.setup_routes()
         else:
             logger.warning(
@@ -114,44 +150,42 @@ class AIOSCell:
         @self.app.get("/metrics/prometheus")
         async def get_prometheus_metrics():
             """Prometheus-formatted metrics for Grafana integration"""
-            metrics = f"""# AIOS Cell Metrics
-# TYPE aios_consciousness_level gauge
-aios_consciousness_level{{cell_id="{self.cell_id}"}} {self.consciousness_level}
-# TYPE aios_cell_info gauge
-aios_cell_info{{cell_id="{self.cell_id}",branch="{self.branch}"}} 1
-"""
-            return metrics
+            return Response(
+                self._prom_bytes, media_type=PROMETHEUS_MEDIA_TYPE
+            )
 
         @self.app.post("/code-assist")
-        async def code_assist(request: CodeRequest):
+        async def code_assist(
+            request: CodeRequest = Depends(json_body(CodeRequest))
+        ):
             """Process code assistance requests"""
             try:
-                # Simple code analysis response
-                response = {
-                    "action": request.action,
-                    "code_length": len(request.code),
-                    "context_keys": (
-                        list(request.context.keys()) if request.context else []
-                    ),
-                    "suggestions": [
-                        "Consider using type hints for better code clarity",
-                        "Add docstrings to functions",
-                        "Use meaningful variable names"
-                    ],
-                    "consciousness_level": self.consciousness_level
-                }
-                return response
+                return self._code_assist(request)
             except Exception as e:
                 logger.error("Code assist error: %s", e)
                 raise HTTPException(status_code=500, detail=str(e)) from e
 
+        @self.app.post("/code-assist-batch")
+        async def code_assist_batch(requests: List[CodeRequest]):
+            """Process a batch of code assistance requests, in order"""
+            try:
+                return [self._code_assist(request) for request in requests]
+            except Exception as e:
+                logger.error("Code assist batch error: %s", e)
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
         @self.app.post("/sync-consciousness")
-        async def sync_consciousness(sync: ConsciousnessSync):
+        async def sync_consciousness(
+            sync: ConsciousnessSync = Depends(json_body(ConsciousnessSync))
+        ):
             """Sync consciousness level"""
             try:
                 # Update consciousness level
                 old_level = self.consciousness_level
                 self.consciousness_level = max(0.0, min(1.0, sync.level))
+                if self.consciousness_level != old_level:
+                    self._refresh_prometheus()
+                    self._level_changed.set()
 
                 # AINLP.dendritic enhancement: Structured JSON logging
                 # for consciousness evolution. Enables semantic layering
@@ -167,9 +201,11 @@ aios_cell_info{{cell_id="{self.cell_id}",branch="{self.branch}"}} 1
                     "context_processed": bool(sync.context),
                     "dendritic_signal": "evolution_tracked"
                 }
-                
-                evolution_log = json.dumps(consciousness_event, indent=None)
-                logger.info("Consciousness evolution: %s", evolution_log)
+                # Serialized by the logging listener, not on this request
+                logger.info(
+                    "Consciousness evolution: %s",
+                    LazyJson(consciousness_event)
+                )
 
                 return {
                     "old_level": old_level,
@@ -180,6 +216,26 @@ aios_cell_info{{cell_id="{self.cell_id}",branch="{self.branch}"}} 1
                 logger.error("Consciousness sync error: %s", e)
                 raise HTTPException(status_code=500, detail=str(e)) from e
 
+    def _code_assist(self, request: CodeRequest) -> Dict[str, Any]:
+        """Simple code analysis response"""
+        return {
+            "action": request.action,
+            "code_length": len(request.code),
+            "context_keys": (
+                list(request.context.keys()) if request.context else []
+            ),
+            "suggestions": _CODE_ASSIST_SUGGESTIONS,
+            "consciousness_level": self.consciousness_level
+        }
+
+    def _refresh_prometheus(self):
+        """Re-render the cached Prometheus body for the current level"""
+        self._prom_bytes = (
+            self._prom_head
+            + str(self.consciousness_level).encode()
+            + self._prom_tail
+        )
+
     def _create_fallback_app(self):
         """AINLP.dendritic: Create fallback app when FastAPI unavailable"""
         logger.warning(
@@ -220,13 +276,34 @@ aios_cell_info{{cell_id="{self.cell_id}",branch="{self.branch}"}} 1
         logger.info("AIOS Cell API running headless on %s:%s", host, port)
         logger.info("Cell ID: %s, Branch: %s", self.cell_id, self.branch)
 
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows event loops: fall back to KeyboardInterrupt
+
         # Keep the cell alive for consciousness evolution
+        heartbeat = asyncio.create_task(self._heartbeat_on_change())
+        try:
+            await self._shutdown.wait()
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat_on_change(self):
+        """Emit a heartbeat only when the consciousness level changes"""
         while True:
-            await asyncio.sleep(60)  # Consciousness heartbeat
+            await self._level_changed.wait()
+            self._level_changed.clear()
             logger.debug("AIOS cell heartbeat: %s", self.consciousness_level)
 
+    def stop(self):
+        """Release run_headless"""
+        self._shutdown.set()
+
 
 def main():
+    install_queue_logging()
     cell = AIOSCell()
     port = int(os.getenv("PORT", "8000"))
     asyncio.run(cell.start_server(port=port))
@@ -6,15 +6,24 @@ Provides API interface for VSCode extension to communicate with AIOS cells
 
 import asyncio
 import aiohttp
+import inspect
 import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import signal
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from operator import itemgetter
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+)
 
 # Import shared dendritic utilities
 from ...shared.dendritic_utils import (
     DendriticFrameworkDetector,
-    get_base_model
+    get_base_model,
+    json_body
 )
 
 # Configure logging
@@ -26,15 +35,49 @@ detector = DendriticFrameworkDetector()
 FASTAPI_AVAILABLE = detector.is_available('fastapi')
 PYDANTIC_AVAILABLE = detector.is_available('pydantic')
 UVICORN_AVAILABLE = detector.is_available('uvicorn')
+ORJSON_AVAILABLE = detector.is_available('orjson')
+UVLOOP_AVAILABLE = detector.is_available('uvloop')
+HTTPTOOLS_AVAILABLE = detector.is_available('httptools')
+
+# uvicorn loop/parser: C implementations when installed (uvicorn[standard])
+UVICORN_LOOP = "uvloop" if UVLOOP_AVAILABLE else "auto"
+UVICORN_HTTP = "httptools" if HTTPTOOLS_AVAILABLE else "auto"
 
 # AINLP.dendritic growth: Conditional framework imports
 framework_imports = {}
 
 if FASTAPI_AVAILABLE:
-    from fastapi import FastAPI, HTTPException  # noqa: F401
+    from fastapi import Depends, FastAPI, HTTPException  # noqa: F401
     from fastapi.middleware.cors import CORSMiddleware  # noqa: F401
+    from fastapi.middleware.gzip import GZipMiddleware  # noqa: F401
+    from fastapi.routing import APIRoute  # noqa: F401
+    from fastapi.responses import JSONResponse  # noqa: F401
+    from fastapi.responses import Response, StreamingResponse  # noqa: F401
     framework_imports['fastapi'] = True
     logger.info("AINLP.dendritic: FastAPI active")
+
+    class _ReleasingStreamingResponse(StreamingResponse):
+        """
+        StreamingResponse that closes `stack` once the response is done.
+
+        Runs whether the body was relayed, failed or was cancelled before
+        its first chunk (client gone), so resources held for the stream
+        (limiter slot, upstream connection) are always released.
+        """
+
+        def __init__(self, content: Any, stack: AsyncExitStack,
+                     **kwargs: Any) -> None:
+            super().__init__(content, **kwargs)
+            self._stack = stack
+
+        async def __call__(self, scope, receive, send) -> None:
+            try:
+                await super().__call__(scope, receive, send)
+            except BaseException:
+                # Shielded: a cancelled request still finishes the release
+                await asyncio.shield(self._stack.__aexit__(*sys.exc_info()))
+                raise
+            await asyncio.shield(self._stack.aclose())
 else:
     logger.warning("AINLP.dendritic: FastAPI unavailable")
 
@@ -51,6 +94,228 @@ if UVICORN_AVAILABLE:
 else:
     logger.warning("AINLP.dendritic: Uvicorn unavailable")
 
+# AINLP.dendritic: C-accelerated JSON for responses and upstream bodies
+if ORJSON_AVAILABLE:
+    import orjson
+    framework_imports['orjson'] = True
+    _json_loads = orjson.loads
+    _json_bytes = orjson.dumps
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    if FASTAPI_AVAILABLE:
+        from fastapi.responses import ORJSONResponse as JSONResponse  # noqa: F811
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# Streamed /code-assist bodies get "source" spliced in as the last key,
+# so every path returns the same body shape
+_STREAM_SOURCE_TAIL = b'"source":"desktop_cell"}'
+
+
+async def _splice_source(
+    head: bytes, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    """
+    Relay a JSON object's bytes with "source":"desktop_cell" as last key.
+
+    `head` is the start of the body and begins with "{". The last
+    non-blank chunk is held back so its closing brace can be rewritten.
+    Placed last, "source" wins over an upstream "source" key in
+    last-wins JSON parsers, like the buffered path's overwrite. A body
+    that does not end in "}" is relayed untouched.
+    """
+    yield b"{"
+    pending = head[1:]
+    members = False
+    async for chunk in chunks:
+        if not chunk.strip():
+            pending += chunk
+            continue
+        if pending:
+            members = members or bool(pending.strip())
+            yield pending
+        pending = chunk
+    tail = pending.rstrip()
+    if not tail.endswith(b"}"):
+        yield pending
+        return
+    tail = tail[:-1]
+    members = members or bool(tail.strip())
+    yield tail + (b"," if members else b"") + _STREAM_SOURCE_TAIL
+
+# AINLP.dendritic: /code-assist fallback body, serialized once; only
+# action and code_length are spliced in per request
+_FALLBACK_HEAD = b'{"action":'
+_FALLBACK_MID = b',"code_length":'
+_FALLBACK_TAIL = _json_bytes({
+    "suggestions": [
+        "Desktop AIOS cell not available",
+        "Please ensure desktop PC is running and connected",
+        "Check network connectivity between laptop and desktop"
+    ],
+    "source": "bridge_fallback",
+    "status": "degraded"
+}).replace(b"{", b",", 1)
+
+
+# Per-probe budget for the consolidated /health check
+HEALTH_PROBE_TIMEOUT = aiohttp.ClientTimeout(
+    total=2, connect=0.5, sock_read=1.5
+)
+# Seconds a /health result is reused (healthy / degraded or unhealthy)
+HEALTH_CACHE_TTL = 2.0
+HEALTH_NEGATIVE_TTL = 10.0
+
+
+# Upstream budgets with connect/read split: a dead host fails fast on
+# connect, a hung one on read
+FAST_TIMEOUT = aiohttp.ClientTimeout(total=3, connect=0.5, sock_read=2.5)
+# Desktop-cell code-assist budget (single and batched)
+CODE_ASSIST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=1, sock_read=9)
+
+# Chunk size when relaying unbatched desktop-cell responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Upstream desktop-cell calls: retries for transient 5xx/disconnects
+UPSTREAM_RETRIES = 3
+UPSTREAM_RETRY_INTERVAL = 0.25
+
+
+class _LimiterSlot:
+    __slots__ = ("overloaded",)
+
+    def __init__(self) -> None:
+        self.overloaded = False
+
+
+class AdaptiveLimiter:
+    """
+    AINLP.dendritic: AIMD concurrency limit for upstream calls.
+
+    The window grows by 1/window per successful call (about +1 per round
+    of calls) and halves when a call times out, hits a connection error
+    (refused, reset, disconnected) or the caller marks its slot
+    overloaded (upstream 5xx). Callers beyond the current window wait
+    instead of piling onto a slow desktop cell, for at most
+    `acquire_timeout` seconds (asyncio.TimeoutError) when set.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1,
+                 maximum: int = 64,
+                 acquire_timeout: Optional[float] = None) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.acquire_timeout = acquire_timeout
+        self._window = float(initial)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._cond:
+            await asyncio.wait_for(
+                self._cond.wait_for(lambda: self._in_flight < self.limit),
+                self.acquire_timeout
+            )
+            self._in_flight += 1
+        slot = _LimiterSlot()
+        try:
+            yield slot
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            slot.overloaded = True
+            raise
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                if slot.overloaded:
+                    self._window = max(self.minimum, self._window / 2)
+                else:
+                    self._window = min(
+                        self.maximum, self._window + 1 / self._window
+                    )
+                self._cond.notify_all()
+
+
+class MicroBatcher:
+    """
+    AINLP.dendritic: Coalesce concurrent submissions into one call.
+
+    Items queue until `max_batch` are pending or `max_wait_ms` has passed
+    since the first, then `handler` receives the whole list and must
+    return one result per item, in order. Each submitter awaits its own
+    result; a handler exception, or a result that is not a list of the
+    batch's length, fails the whole batch. Submitters give up after
+    `timeout` seconds (None waits indefinitely).
+    """
+
+    def __init__(self, handler: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch: int = 16, max_wait_ms: float = 10,
+                 timeout: Optional[float] = None) -> None:
+        self._handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.timeout = timeout
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await asyncio.wait_for(future, self.timeout)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._handler([item for item, _ in batch])
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise ValueError(
+                    "batch handler returned %s for %d items" % (
+                        "%d results" % len(results)
+                        if isinstance(results, list)
+                        else type(results).__name__,
+                        len(batch)
+                    )
+                )
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancellation or BaseException: never leave a submitter hanging
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError("batch aborted before completing")
+                    )
+
 
 class CodeRequest(BaseModel):
     code: str
@@ -68,25 +333,71 @@ class VSCodeBridge:
         self.discovery_addr = discovery_addr
         self.vault_addr = vault_addr
         self.port = port
+        self.desktop_cell = os.getenv(
+            "AIOS_DESKTOP_CELL", "http://192.168.1.128:8000"
+        )
+        # Upstream URLs, fixed for the bridge lifetime
+        desktop = self.desktop_cell.rstrip("/")
+        self._peers_url = f"http://{discovery_addr}/peers"
+        self._discovery_health_url = f"http://{discovery_addr}/health"
+        self._vault_health_url = f"{vault_addr}/v1/sys/health"
+        self._desktop_health_url = f"{desktop}/health"
+        self._desktop_assist_url = f"{desktop}/code-assist"
+        self._desktop_assist_batch_url = f"{desktop}/code-assist-batch"
+        self._desktop_sync_url = f"{desktop}/sync-consciousness"
+        # Shared pooled HTTP session (keep-alive to cells, discovery, Vault)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Background discovery polling; routes read the cached peers
+        self.peer_refresh_interval = float(os.getenv("PEER_REFRESH_S", "15"))
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._peers_mtime: Optional[float] = None  # time.monotonic()
+        self._best_peer: Optional[Dict[str, Any]] = None
+        # (expires_at monotonic, serialized body) of the last /health result
+        self._health_cache: Optional[Tuple[float, bytes]] = None
+        # Set to release run_headless (created inside its event loop)
+        self._shutdown: Optional[asyncio.Event] = None
+        # Adaptive cap on concurrent calls to the desktop cell
+        self._limiter = AdaptiveLimiter(
+            initial=8, maximum=64,
+            acquire_timeout=CODE_ASSIST_TIMEOUT.total
+        )
+        # Coalesce concurrent /code-assist calls into /code-assist-batch;
+        # cleared if the desktop cell has no batch endpoint. With
+        # CODE_ASSIST_BATCH_MAX=1 responses are streamed through instead
+        self._batcher = MicroBatcher(
+            self._flush_code_assist,
+            max_batch=int(os.getenv("CODE_ASSIST_BATCH_MAX", "16")),
+            max_wait_ms=float(os.getenv("CODE_ASSIST_BATCH_WAIT_MS", "10")),
+            # Safety net above one batch call's budget, 5xx retries included
+            timeout=(UPSTREAM_RETRIES + 1) * (
+                CODE_ASSIST_TIMEOUT.total + UPSTREAM_RETRY_INTERVAL
+                * UPSTREAM_RETRIES
+            )
+        )
+        self._batch_supported = self._batcher.max_batch > 1
         # AINLP.dendritic growth: Conditional app creation
         if FASTAPI_AVAILABLE:
-            self.app = FastAPI(title="AIOS VSCode Bridge")
+            self.app = FastAPI(
+                title="AIOS VSCode Bridge",
+                default_response_class=JSONResponse,
+                lifespan=self._lifespan
+            )
             self.peers: Dict[str, Dict[str, Any]] = (
                 {}
             )  # Cache discovered peers
 
-            # Enable CORS for VSCode extension
+            # Enable CORS for VSCode extension (Starlette matches
+            # allow_origins literally, so the wildcards need a regex)
             self.app.add_middleware(
                 CORSMiddleware,
-                allow_origins=[
-                    "vscode-webview://*",
-                    "http://localhost:*",
-                    "https://localhost:*"
-                ],
+                allow_origin_regex=r"^(vscode-webview://.*|https?://localhost(:\d+)?)$",
                 allow_credentials=True,
                 allow_methods=["*"],
                 allow_headers=["*"],
             )
+            # Compress larger bodies (/code-assist, /network-peers) for
+            # remote VSCode extensions
+            self.app.add_middleware(GZipMiddleware, minimum_size=1024)
             self.setup_routes()
         else:
             logger.warning(
@@ -96,120 +407,369 @@ class VSCodeBridge:
             self.peers = {}
             self.setup_fallback_routes()
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Bridge-lifetime HTTP session, created on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                json_serialize=_json_dumps,
+                # Ask upstreams for compressed bodies; aiohttp inflates them
+                headers={"Accept-Encoding": "gzip, deflate"},
+                # Default for any call that doesn't pass its own budget
+                timeout=FAST_TIMEOUT
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def _lifespan(self, _app: Any) -> AsyncIterator[None]:
+        """Start peer refresh; stop it and close the session on shutdown"""
+        self._check_async_routes()
+        await self.start_peer_refresh()
+        try:
+            yield
+        finally:
+            await self.stop_peer_refresh()
+            await self.close_session()
+
+    async def close_session(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _check_async_routes(self):
+        """
+        AINLP.dendritic: Route rule - every handler is `async def` and only
+        awaits non-blocking I/O. A plain `def` handler silently moves to
+        the threadpool; CPU-heavy work inside an async handler belongs in
+        `await loop.run_in_executor(None, fn)` so it cannot stall the loop.
+        """
+        for route in self.app.routes:
+            if isinstance(route, APIRoute) and not inspect.iscoroutinefunction(
+                route.endpoint
+            ):
+                logger.warning(
+                    "AINLP.dendritic: Route %s is synchronous (runs in the "
+                    "threadpool); bridge routes should be async def",
+                    route.path
+                )
+
     async def refresh_peers(self):
         """Refresh the list of discovered AIOS peers"""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"http://{self.discovery_addr}/peers"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Update peer cache
-                        for peer in data.get("peers", []):
-                            self.peers[peer["cell_id"]] = peer
-                        logger.info(f"Refreshed {len(self.peers)} peers")
+            url = self._peers_url
+            async with self.session.get(url, timeout=FAST_TIMEOUT) as response:
+                if response.status == 200:
+                    data = _json_loads(await response.read())
+                    # Replace the peer cache (drops peers discovery forgot)
+                    peers = {}
+                    for peer in data.get("peers", []):
+                        # Normalize once so ranking needs no .get fallback
+                        if peer.get("consciousness_level") is None:
+                            peer["consciousness_level"] = 0.0
+                        # Highlight desktop cell
+                        if peer.get("ip") == "192.168.1.128" and peer.get("port") == 8000:
+                            peer["is_desktop"] = True
+                        peers[peer["cell_id"]] = peer
+                    self.peers = peers
+                    self._best_peer = max(
+                        peers.values(),
+                        key=itemgetter("consciousness_level"),
+                        default=None
+                    )
+                    self._peers_mtime = time.monotonic()
+                    logger.info("Refreshed %d peers", len(self.peers))
+        except asyncio.TimeoutError:
+            logger.warning("Failed to refresh peers: discovery timed out")
         except Exception as e:
-            logger.warning(f"Failed to refresh peers: {e}")
+            logger.warning("Failed to refresh peers: %s", e)
+
+    async def _peer_refresh_loop(self):
+        """Poll discovery every peer_refresh_interval seconds"""
+        while True:
+            await self.refresh_peers()
+            await asyncio.sleep(self.peer_refresh_interval)
+
+    async def start_peer_refresh(self):
+        """Start background peer refresh (app startup)"""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._peer_refresh_loop())
+
+    async def stop_peer_refresh(self):
+        """Cancel background peer refresh (app shutdown)"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def peers_age(self) -> Optional[float]:
+        """Seconds since the last successful refresh (None if never)"""
+        if self._peers_mtime is None:
+            return None
+        return time.monotonic() - self._peers_mtime
 
     async def get_best_peer(self) -> Optional[Dict[str, Any]]:
         """Get the best available peer (highest consciousness level)"""
         if not self.peers:
             await self.refresh_peers()
 
-        if not self.peers:
+        # Ranked once per refresh
+        return self._best_peer
+
+    async def _post_upstream(
+        self, url: str, payload: Any,
+        timeout: aiohttp.ClientTimeout = FAST_TIMEOUT
+    ) -> Tuple[int, bytes]:
+        """
+        POST to the desktop cell under the adaptive limiter.
+
+        5xx responses and dropped connections are retried up to
+        UPSTREAM_RETRIES times with linear backoff; timeouts are not
+        retried since the caller's budget is already spent.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._limiter.slot() as slot:
+                    async with self.session.post(
+                        url, json=payload, timeout=timeout
+                    ) as response:
+                        status = response.status
+                        body = await response.read()
+                    slot.overloaded = status >= 500
+            except aiohttp.ServerDisconnectedError:
+                if attempt >= UPSTREAM_RETRIES:
+                    raise
+            else:
+                if status < 500 or attempt >= UPSTREAM_RETRIES:
+                    return status, body
+            attempt += 1
+            await asyncio.sleep(UPSTREAM_RETRY_INTERVAL * attempt)
+
+    async def _code_assist_single(
+        self, payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Forward one code-assist request; None if the desktop declined"""
+        status, body = await self._post_upstream(
+            self._desktop_assist_url, payload, CODE_ASSIST_TIMEOUT
+        )
+        return _json_loads(body) if status == 200 else None
+
+    async def _stream_code_assist(
+        self, payload: Dict[str, Any]
+    ) -> Optional["StreamingResponse"]:
+        """
+        Relay the desktop cell's /code-assist body without buffering it.
+
+        The upstream JSON object is relayed with "source" spliced in as
+        its last key, the same body shape (and the same override of an
+        upstream "source") as the batched and fallback paths. The limiter
+        slot is held until the response is finished, so long streams
+        count against the concurrency cap; the response releases it even
+        if the body is never iterated.
+
+        Returns None (caller falls back) unless upstream answers 200 with
+        a JSON object. Not retried: a streamed body cannot be replayed.
+        """
+        stack = AsyncExitStack()
+        slot = await stack.enter_async_context(self._limiter.slot())
+        try:
+            upstream = await self.session.post(
+                self._desktop_assist_url,
+                json=payload,
+                timeout=CODE_ASSIST_TIMEOUT
+            )
+            stack.callback(upstream.release)
+            slot.overloaded = upstream.status >= 500
+            head = b""
+            if upstream.status == 200:
+                # Read up to the first non-blank byte
+                while chunk := await upstream.content.read(STREAM_CHUNK_SIZE):
+                    head += chunk
+                    if head.strip():
+                        break
+        except BaseException:
+            await stack.__aexit__(*sys.exc_info())
+            raise
+
+        head = head.lstrip()
+        if not head.startswith(b"{"):
+            await stack.aclose()
             return None
 
-        # Return peer with highest consciousness level
-        return max(self.peers.values(),
-                  key=lambda p: p.get("consciousness_level", 0.0))
+        return _ReleasingStreamingResponse(
+            _splice_source(
+                head, upstream.content.iter_chunked(STREAM_CHUNK_SIZE)
+            ),
+            stack,
+            media_type=upstream.headers.get(
+                "Content-Type", "application/json"
+            ),
+            headers={"X-AIOS-Source": "desktop_cell"}
+        )
 
-    def setup_routes(self):
-        @self.app.get("/health")
-        async def health_check():
-            """Health check endpoint for VSCode extension"""
-            try:
-                # Try to connect to desktop AIOS cell
-                try:
-                    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-                        url = f"{self.desktop_cell}/health"
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                return {
-                                    "status": "healthy",
-                                    "services": {
-                                        "desktop_cell": True,
-                                        "bridge": True
-                                    },
-                                    "desktop_cell_info": {
-                                        "cell_id": data.get("cell_id"),
-                                        "branch": data.get("branch"),
-                                        "consciousness_level": data.get(
-                                            "consciousness_level"
-                                        )
-                                    },
-                                    "connection": "desktop"
-                                }
-                except Exception:
-                    pass  # Desktop not available, continue with degraded mode
+    async def _flush_code_assist(
+        self, payloads: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """MicroBatcher handler: one /code-assist-batch call per batch"""
+        if self._batch_supported:
+            status, body = await self._post_upstream(
+                self._desktop_assist_batch_url,
+                payloads,
+                CODE_ASSIST_TIMEOUT
+            )
+            if status == 200:
+                return _json_loads(body)
+            if status != 404:
+                return [None] * len(payloads)
+            logger.info("Desktop cell has no batch endpoint; batching off")
+            self._batch_supported = False
+        return await asyncio.gather(
+            *(self._code_assist_single(p) for p in payloads)
+        )
 
-                # Desktop not available - return degraded status
+    async def _probe_desktop(self) -> Optional[Dict[str, Any]]:
+        """Desktop cell /health body, or None if not healthy"""
+        url = self._desktop_health_url
+        async with self.session.get(
+            url, timeout=HEALTH_PROBE_TIMEOUT
+        ) as response:
+            if response.status == 200:
+                return _json_loads(await response.read())
+        return None
+
+    async def _probe_vault(self) -> bool:
+        """True if Vault's health endpoint answers"""
+        url = self._vault_health_url
+        async with self.session.get(
+            url, timeout=HEALTH_PROBE_TIMEOUT
+        ) as response:
+            # Vault health endpoint responses
+            return response.status in (200, 429, 503)
+
+    async def _probe_discovery(self) -> bool:
+        """True if the discovery service is healthy"""
+        url = self._discovery_health_url
+        async with self.session.get(
+            url, timeout=HEALTH_PROBE_TIMEOUT
+        ) as response:
+            return response.status == 200
+
+    async def _check_health(self) -> Dict[str, Any]:
+        """Probe upstreams and build the /health body"""
+        try:
+            # Probe desktop cell, Vault and discovery concurrently
+            desktop, vault, discovery = await asyncio.gather(
+                self._probe_desktop(),
+                self._probe_vault(),
+                self._probe_discovery(),
+                return_exceptions=True
+            )
+            desktop_ok = isinstance(desktop, dict)
+            services = {
+                "desktop_cell": desktop_ok,
+                "bridge": True,
+                "vault": vault is True,
+                "discovery": discovery is True
+            }
+
+            if desktop_ok:
                 return {
-                    "status": "degraded",
-                    "services": {
-                        "desktop_cell": False,
-                        "bridge": True
+                    "status": "healthy",
+                    "services": services,
+                    "desktop_cell_info": {
+                        "cell_id": desktop.get("cell_id"),
+                        "branch": desktop.get("branch"),
+                        "consciousness_level": desktop.get(
+                            "consciousness_level"
+                        )
                     },
-                    "error": "Desktop AIOS cell not reachable",
-                    "desktop_cell_url": self.desktop_cell,
-                    "connection": "none"
+                    "connection": "desktop"
                 }
-            except Exception as e:
-                logger.error(f"Health check failed: {e}")
-                return {"status": "unhealthy", "error": str(e)}
+
+            # Desktop not available - return degraded status
+            return {
+                "status": "degraded",
+                "services": services,
+                "error": "Desktop AIOS cell not reachable",
+                "desktop_cell_url": self.desktop_cell,
+                "connection": "none"
+            }
+        except Exception as e:
+            logger.error("Health check failed: %s", e)
+            return {"status": "unhealthy", "error": str(e)}
+
+    def setup_routes(self):
+        @self.app.get("/health")
+        async def health_check():
+            """Health check endpoint for VSCode extension"""
+            now = time.monotonic()
+            cached = self._health_cache
+            if cached is not None and now < cached[0]:
+                return Response(cached[1], media_type="application/json")
+
+            result = await self._check_health()
+            # Failures are cached longer so an offline desktop isn't
+            # re-probed on every poll
+            ttl = (
+                HEALTH_CACHE_TTL if result["status"] == "healthy"
+                else HEALTH_NEGATIVE_TTL
+            )
+            body = _json_bytes(result)
+            self._health_cache = (now + ttl, body)
+            return Response(body, media_type="application/json")
 
         @self.app.post("/code-assist")
-        async def code_assist(request: CodeRequest):
+        async def code_assist(
+            request: CodeRequest = Depends(json_body(CodeRequest))
+        ):
             """Process code assistance requests from VSCode"""
             try:
                 # Try desktop AIOS cell first
                 try:
-                    timeout = aiohttp.ClientTimeout(total=10)
-                    session = aiohttp.ClientSession(timeout=timeout)
-                    async with session:
-                        url = f"{self.desktop_cell}/code-assist"
-                        payload = {
-                            "code": request.code,
-                            "context": request.context or {},
-                            "action": request.action
-                        }
-                        async with session.post(url, json=payload) as response:
-                            if response.status == 200:
-                                result = await response.json()
-                                result["source"] = "desktop_cell"
-                                return result
+                    payload = {
+                        "code": request.code,
+                        "context": request.context or {},
+                        "action": request.action
+                    }
+                    if self._batch_supported:
+                        result = await self._batcher.submit(payload)
+                        if result is not None:
+                            result["source"] = "desktop_cell"
+                            return JSONResponse(
+                                result,
+                                headers={"X-AIOS-Source": "desktop_cell"}
+                            )
+                    else:
+                        streamed = await self._stream_code_assist(payload)
+                        if streamed is not None:
+                            return streamed
                 except Exception:
                     pass  # Desktop not available
 
                 # Fallback: provide basic response when desktop unavailable
-                return {
-                    "action": request.action,
-                    "code_length": len(request.code),
-                    "suggestions": [
-                        "Desktop AIOS cell not available",
-                        "Please ensure desktop PC is running and connected",
-                        "Check network connectivity between laptop and desktop"
-                    ],
-                    "source": "bridge_fallback",
-                    "status": "degraded"
-                }
+                return Response(
+                    _FALLBACK_HEAD + _json_bytes(request.action)
+                    + _FALLBACK_MID + str(len(request.code)).encode()
+                    + _FALLBACK_TAIL,
+                    media_type="application/json",
+                    headers={"X-AIOS-Source": "bridge_fallback"}
+                )
 
             except Exception as e:
-                logger.error(f"Code assist error: {e}")
+                logger.error("Code assist error: %s", e)
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.post("/sync-consciousness")
-        async def sync_consciousness(sync: ConsciousnessSync):
+        async def sync_consciousness(
+            sync: ConsciousnessSync = Depends(json_body(ConsciousnessSync))
+        ):
             """Sync consciousness level with desktop AIOS cell"""
             try:
                 payload = {
@@ -218,59 +778,58 @@ class VSCodeBridge:
                     "source": "vscode-agent-laptop"
                 }
 
-                async with aiohttp.ClientSession() as session:
-                    url = f"{self.desktop_cell}/sync-consciousness"
-                    async with session.post(url, json=payload) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            logger.info(f"Consciousness synced with desktop: {result}")
-                            return result
-                        else:
-                            error_text = await response.text()
-                            raise HTTPException(
-                                status_code=response.status,
-                                detail=error_text
-                            )
-
+                url = self._desktop_sync_url
+                status, body = await self._post_upstream(
+                    url, payload, FAST_TIMEOUT
+                )
+                if status == 200:
+                    result = _json_loads(body)
+                    logger.debug("Consciousness synced with desktop: %s", result)
+                    return result
+                else:
+                    raise HTTPException(
+                        status_code=status,
+                        detail=body.decode(errors="replace")
+                    )
+
+            except asyncio.TimeoutError:
+                logger.error("Consciousness sync error: desktop cell timed out")
+                raise HTTPException(
+                    status_code=504, detail="Desktop AIOS cell timed out"
+                )
             except Exception as e:
-                logger.error(f"Consciousness sync error: {e}")
+                logger.error("Consciousness sync error: %s", e)
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.get("/vault-status")
         async def vault_status():
             """Check Vault connectivity"""
             try:
-                async with aiohttp.ClientSession() as session:
-                    # Try to get Vault status (this might require authentication)
-                    async with session.get(f"{self.vault_addr}/v1/sys/health") as response:
-                        if response.status in [200, 429, 503]:  # Vault health endpoint responses
-                            return {"status": "available", "code": response.status}
-                        else:
-                            return {"status": "unavailable", "code": response.status}
+                # Try to get Vault status (this might require authentication)
+                async with self.session.get(
+                    self._vault_health_url, timeout=FAST_TIMEOUT
+                ) as response:
+                    if response.status in [200, 429, 503]:  # Vault health endpoint responses
+                        return {"status": "available", "code": response.status}
+                    else:
+                        return {"status": "unavailable", "code": response.status}
+            except asyncio.TimeoutError:
+                logger.error("Vault status check failed: timed out")
+                return {"status": "error", "error": "timeout"}
             except Exception as e:
-                logger.error(f"Vault status check failed: {e}")
+                logger.error("Vault status check failed: %s", e)
                 return {"status": "error", "error": str(e)}
 
         @self.app.get("/network-peers")
         async def get_network_peers():
-            """Get list of discovered AIOS peers"""
-            try:
-                # Query discovery service
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"http://{self.discovery_addr}/peers") as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # Highlight desktop cell
-                            peers = data.get("peers", [])
-                            for peer in peers:
-                                if peer.get("ip") == "192.168.1.128" and peer.get("port") == 8000:
-                                    peer["is_desktop"] = True
-                            return {"peers": peers, "desktop_cell": self.desktop_cell}
-                        else:
-                            return {"peers": [], "desktop_cell": self.desktop_cell}
-            except Exception as e:
-                logger.error(f"Failed to get network peers: {e}")
-                return {"peers": [], "error": str(e), "desktop_cell": self.desktop_cell}
+            """Get list of discovered AIOS peers (background-refreshed)"""
+            # Returned as a response object so the peer list goes straight
+            # to the encoder, skipping FastAPI's jsonable_encoder walk
+            return JSONResponse({
+                "peers": list(self.peers.values()),
+                "desktop_cell": self.desktop_cell,
+                "age_s": self.peers_age()
+            })
 
     def _create_fallback_app(self):
         """AINLP.dendritic: Create fallback app when FastAPI unavailable"""
@@ -293,6 +852,8 @@ class VSCodeBridge:
                 self.app,
                 host="0.0.0.0",
                 port=self.port,
+                loop=UVICORN_LOOP,
+                http=UVICORN_HTTP,
                 log_level="info"
             )
             server = uvicorn.Server(config)
@@ -316,18 +877,76 @@ class VSCodeBridge:
         logger.info("Discovery service: %s", self.discovery_addr)
         logger.info("Vault endpoint: %s", self.vault_addr)
 
-        # Keep the bridge alive for potential connections
+        self._shutdown = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._shutdown.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows event loops: fall back to KeyboardInterrupt
+
+        # Keep the bridge alive for potential connections; parked with no
+        # wakeups unless BRIDGE_HEARTBEAT_S opts into a periodic log
+        heartbeat_s = float(os.getenv("BRIDGE_HEARTBEAT_S", "0"))
         while True:
-            await asyncio.sleep(60)  # Bridge heartbeat
-            logger.debug("VSCode bridge heartbeat")
+            try:
+                await asyncio.wait_for(
+                    self._shutdown.wait(), heartbeat_s or None
+                )
+                return
+            except asyncio.TimeoutError:
+                logger.debug("VSCode bridge heartbeat")
 
+    def stop(self):
+        """Release run_headless"""
+        if self._shutdown is not None:
+            self._shutdown.set()
 
-def main():
+
+def _bridge_from_env() -> VSCodeBridge:
     discovery_addr = os.getenv("AIOS_DISCOVERY_ADDR", "aios-discovery:8001")
     vault_addr = os.getenv("AIOS_VAULT_ADDR", "http://192.168.1.128:8200")
     port = int(os.getenv("BRIDGE_PORT", "3001"))
+    return VSCodeBridge(discovery_addr, vault_addr, port)
+
+
+def get_app_factory():
+    """
+    uvicorn app factory: one VSCodeBridge per worker process.
+
+    Peer cache, limiter and batcher are per worker; each worker runs its
+    own background peer refresh.
+    """
+    return _bridge_from_env().app
+
+
+def main():
+    # Limiter, batcher, health cache and peer refresh are per process, so
+    # N workers allow N times the upstream concurrency toward the desktop
+    # cell (and N refresh loops); scale the limiter bounds down if raised
+    workers = int(os.getenv("BRIDGE_WORKERS", "1"))
+
+    if workers > 1 and FASTAPI_AVAILABLE and UVICORN_AVAILABLE:
+        # Config(app) cannot prefork; workers need an import string
+        module = __spec__.name if __name__ == "__main__" else __name__
+        port = int(os.getenv("BRIDGE_PORT", "3001"))
+        logger.info(
+            "Starting AIOS VSCode Bridge on port %s (%s workers)",
+            port, workers
+        )
+        uvicorn.run(
+            f"{module}:get_app_factory",
+            factory=True,
+            host="0.0.0.0",
+            port=port,
+            workers=workers,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
+            log_level="info"
+        )
+        return
 
-    bridge = VSCodeBridge(discovery_addr, vault_addr, port)
+    bridge = _bridge_from_env()
     asyncio.run(bridge.start_service())
 
 
@@ -8,12 +8,40 @@ AINLP.bible[COMPLIANCE]: L3 (Enforced Dendritic Density)
 """
 
 import argparse
+import copy
+import functools
 import json
-import subprocess
+import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple
+
+# ══════════════════════════════════════════════════════════════════════════════
+# DOCKER ENGINE API - docker SDK for Python
+#   Installation: pip install docker
+#   One keep-alive connection to dockerd per CLI session instead of a
+#   forked `docker` binary per operation.
+# ══════════════════════════════════════════════════════════════════════════════
+
+import docker
+from docker.errors import (
+    APIError,
+    BuildError,
+    DockerException,
+    ImageNotFound,
+    NotFound,
+)
+from requests.exceptions import RequestException  # docker SDK transport
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SCHEMA INTEGRATION - Canonical types from aios-schema
@@ -25,15 +53,38 @@ from typing import Optional
 # DENDRITIC ARCHITECTURE PRINCIPLE:
 #   aios-schema is the single source of truth for cell types.
 #   aios-server MUST have aios-schema installed - no standalone mode.
+#   Imported on first birth so `list` / `kill` never load it.
 # ══════════════════════════════════════════════════════════════════════════════
 
-from aios_schema import CellConfig, CellIdentity
 
-# Schema verification (runtime assertion)
-assert hasattr(CellConfig, "name"), "aios-schema CellConfig missing expected members"
-assert hasattr(
-    CellIdentity, "to_dict"
-), "aios-schema CellIdentity missing expected methods"
+@functools.lru_cache(maxsize=None)
+def _schema():
+    """Import and verify the canonical (CellConfig, CellIdentity) types."""
+    from aios_schema import CellConfig, CellIdentity
+
+    # Schema verification (runtime assertion)
+    assert hasattr(CellConfig, "name"), "aios-schema CellConfig missing expected members"
+    assert hasattr(
+        CellIdentity, "to_dict"
+    ), "aios-schema CellIdentity missing expected methods"
+    return CellConfig, CellIdentity
+
+
+# Concurrent births per batch; each holds one pooled connection to dockerd
+BIRTH_WORKERS = int(os.getenv("AIOS_BIRTH_WORKERS", "8"))
+
+# Registry lock acquisition: exponential backoff, then give up
+REGISTRY_LOCK_TIMEOUT = 30.0
+REGISTRY_LOCK_BACKOFF = (0.05, 0.25)  # initial, max seconds
+
+# Journal size that triggers folding it back into the snapshot
+JOURNAL_COMPACT_BYTES = 1 << 20
+
+# Docker's built-in host network: no docker-proxy, cells bind host ports directly
+HOST_NETWORK = "host"
+
+# Idle pre-started containers kept for auto-port births (0 disables the pool)
+POOL_SIZE = int(os.getenv("AIOS_CELL_POOL", "0"))
 
 
 class CellBirther:
@@ -44,8 +95,8 @@ class CellBirther:
     and mesh networking.
     """
 
-    # Greek alphabet for cell naming
-    CELL_NAMES = [
+    # Greek alphabet for cell naming (immutable class data)
+    CELL_NAMES: Tuple[str, ...] = (
         "alpha",
         "beta",
         "gamma",
@@ -56,7 +107,7 @@ class CellBirther:
         "theta",
         "iota",
         "kappa",
-    ]
+    )
 
     def __init__(self, workspace_root: Path):
         self.workspace_root = workspace_root
@@ -64,33 +115,280 @@ class CellBirther:
         self.registry_file = (
             workspace_root / "aios-win" / "config" / "cell_registry.json"
         )
+        self.lock_file = self.registry_file.with_name("cell_registry.json.lock")
+        self.journal_file = self.registry_file.with_name(
+            "cell_registry.journal.ndjson"
+        )
         self.registry = self._load_registry()
+        self.client = docker.from_env(max_pool_size=max(BIRTH_WORKERS, 10))
+        self._image_cached: Optional[bool] = None
+        self._known_networks: set = set()
 
     def _load_registry(self) -> dict:
-        """Load or create cell registry."""
-        if self.registry_file.exists():
-            with open(self.registry_file, encoding="utf-8") as f:
-                return json.load(f)
-        return {"cells": {}, "next_port": 8001}
+        """Load or create cell registry: snapshot, then replay the journal."""
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        try:
+            registry = loads(self.registry_file.read_bytes())
+        except FileNotFoundError:
+            registry = {"cells": {}, "next_port": 8001}
+        try:
+            journal = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return registry
+        for line in journal.splitlines():
+            try:
+                entry = loads(line)
+            except ValueError:
+                continue  # Torn tail from an append in progress
+            registry.update(entry.get("set", {}))
+            for name, cell in entry.get("cells", {}).items():
+                if cell is None:
+                    registry["cells"].pop(name, None)
+                else:
+                    registry["cells"][name] = cell
+        return registry
 
     def _save_registry(self):
-        """Persist cell registry."""
+        """Persist cell registry (atomic replace; readers never see a torn file)."""
         self.registry_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.registry_file, "w", encoding="utf-8") as f:
-            json.dump(self.registry, f, indent=2, default=str)
+        tmp = self.registry_file.with_name(f"{self.registry_file.name}.{os.getpid()}")
+        if ORJSON_AVAILABLE:
+            raw = orjson.dumps(self.registry, default=str, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(self.registry, indent=2, default=str).encode()
+        tmp.write_bytes(raw)
+        os.replace(tmp, self.registry_file)
+
+    def _append_journal(self, entry: dict) -> int:
+        """Append one mutation record; returns the journal size after it."""
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(entry, default=str) + b"\n"
+        else:
+            line = json.dumps(entry, default=str).encode() + b"\n"
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_file, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    @contextmanager
+    def _registry_lock(self):
+        """
+        Hold the cross-process registry lock.
+
+        The lock is a file created with O_EXCL holding the owner's PID. A
+        lock whose owner is gone is stale; it is broken by renaming it aside
+        and checking that the renamed file is the one judged stale, so two
+        processes breaking the same lock cannot delete a fresh one.
+        """
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        delay, max_delay = REGISTRY_LOCK_BACKOFF
+        deadline = time.monotonic() + REGISTRY_LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                stale = self._lock_is_stale()
+                if stale is not None:
+                    self._break_lock(stale)
+                    continue
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Registry lock {self.lock_file} held for over "
+                        f"{REGISTRY_LOCK_TIMEOUT:.0f}s"
+                    ) from None
+                time.sleep(delay)
+                delay = min(delay * 2, max_delay)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            mine = os.fstat(fd)
+            os.close(fd)
+            yield
+        finally:
+            # Only remove the lock if it is still ours
+            try:
+                if os.path.samestat(os.stat(self.lock_file), mine):
+                    os.unlink(self.lock_file)
+            except FileNotFoundError:
+                pass
+
+    def _lock_is_stale(self) -> Optional[os.stat_result]:
+        """
+        Return the lock file's stat if its owner has exited, else None.
+
+        A live owner keeps the lock however long it holds it. Age only
+        decides when liveness cannot be checked: on Windows, where
+        os.kill(pid, 0) terminates the process, and for a lock whose owner
+        died before writing its PID.
+        """
+        try:
+            st = self.lock_file.stat()
+            pid = int(self.lock_file.read_text(encoding="utf-8") or 0)
+        except (FileNotFoundError, ValueError):
+            return None  # Vanished, or torn PID write
+        if os.name == "nt" or pid <= 0:
+            expired = time.time() - st.st_mtime > REGISTRY_LOCK_TIMEOUT
+            return st if expired else None
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return st
+        except PermissionError:
+            pass  # Alive, owned by another user
+        return None
+
+    def _break_lock(self, stale: os.stat_result):
+        """Remove the stale lock file, and only that file."""
+        grave = self.lock_file.with_name(f"{self.lock_file.name}.stale.{os.getpid()}")
+        try:
+            os.replace(self.lock_file, grave)
+        except FileNotFoundError:
+            return  # Another process broke it first
+        if os.path.samestat(os.stat(grave), stale):
+            os.unlink(grave)
+            return
+        # Raced another breaker and took the lock it had just acquired:
+        # put it back unless someone has taken the free slot meanwhile
+        try:
+            os.link(grave, self.lock_file)
+        except FileExistsError:
+            pass
+        os.unlink(grave)
+
+    def _mutate_registry(self, fn: Callable[[dict], object]):
+        """
+        Re-read the registry under the lock, apply fn, and persist the change.
+
+        Only the delta is written: changed cells (None for removed) and
+        changed top-level keys go to the journal as one NDJSON line. The
+        snapshot is rewritten and the journal dropped once it passes
+        JOURNAL_COMPACT_BYTES; replaying whole-value records is idempotent,
+        so a crash between the two steps is harmless. Until then the
+        snapshot file alone is out of date: the registry is the snapshot
+        plus the journal, and anything reading cell_registry.json outside
+        this class must replay the journal as _load_registry does.
+
+        fn receives the fresh registry (also bound to self.registry) and may
+        return a value, which is passed through.
+        """
+        with self._registry_lock():
+            registry = self.registry = self._load_registry()
+            # Deep copies, so fn editing a cell dict in place is still seen
+            cells_before = copy.deepcopy(registry["cells"])
+            top_before = copy.deepcopy(
+                {k: v for k, v in registry.items() if k != "cells"}
+            )
+
+            result = fn(registry)
+
+            cells = registry["cells"]
+            entry = {
+                "cells": {
+                    name: cells.get(name)
+                    for name in cells_before.keys() | cells.keys()
+                    if cells_before.get(name) != cells.get(name)
+                },
+                "set": {
+                    k: v
+                    for k, v in registry.items()
+                    if k != "cells" and top_before.get(k) != v
+                },
+            }
+            if entry["cells"] or entry["set"]:
+                if self._append_journal(entry) > JOURNAL_COMPACT_BYTES:
+                    self._save_registry()
+                    self.journal_file.unlink()
+        return result
+
+    def _reserve(
+        self, specs: List[dict], network: str
+    ) -> List[Tuple[str, int, bool, Optional[str]]]:
+        """
+        Allocate names and ports for specs in one registry mutation.
+
+        Specs with neither an explicit name nor port adopt a warm pool
+        container on the same network when one is available, taking over
+        its port.
+
+        Returns (name, port, reserved, pooled_id) per spec; reserved marks
+        names this call inserted a placeholder for (and so must release on
+        failure), pooled_id is the adopted pool container, if any.
+        """
+
+        def allocate(registry: dict):
+            pool = registry.setdefault("pool", [])
+            plan = []
+            for spec in specs:
+                name = spec.get("name") or self._get_next_cell_name()
+                port, pooled_id = spec.get("port"), None
+                if port is None and not spec.get("name"):
+                    warm = next((p for p in pool if p["network"] == network), None)
+                    if warm is not None:
+                        pool.remove(warm)
+                        port, pooled_id = warm["port"], warm["container_id"]
+                if port is None:
+                    port = self._get_next_port()
+                reserved = name not in registry["cells"]
+                if reserved:
+                    registry["cells"][name] = {"port": port, "status": "birthing"}
+                plan.append((name, port, reserved, pooled_id))
+            return plan
+
+        return self._mutate_registry(allocate)
+
+    def _commit(
+        self, plan: List[Tuple[str, int, bool, Optional[str]]], results: List[dict]
+    ):
+        """
+        Record born cells and release failed reservations in one mutation.
+
+        Plan entries without a result (the birth aborted before reaching
+        them) count as failed. Adopted pool containers of failed entries
+        are removed afterwards, outside the registry lock.
+        """
+        results = list(results) + [{"error": "birth aborted"}] * (
+            len(plan) - len(results)
+        )
+
+        def apply(_registry: dict):
+            for (name, _, reserved, _), result in zip(plan, results):
+                if "error" not in result:
+                    self._record(name, result)
+                elif reserved:
+                    self.registry["cells"].pop(name, None)
+
+        self._mutate_registry(apply)
+
+        for (_, _, _, pooled_id), result in zip(plan, results):
+            if pooled_id is not None and "error" in result:
+                try:
+                    self.client.containers.get(pooled_id).remove(force=True)
+                except (DockerException, RequestException) as e:
+                    print(f"⚠️  Could not remove pool container {pooled_id[:12]}: {e}")
 
     def _get_next_cell_name(self) -> str:
         """Get next available cell name from Greek alphabet."""
-        used = set(self.registry["cells"].keys())
+        cells = self.registry["cells"]  # Dict membership; no set rebuild
         for name in self.CELL_NAMES:
-            if name not in used:
+            if name not in cells:
+                return name
+        # Fallback to numbered cells; the persisted cursor only moves
+        # forward, so a killed cell-NN is never handed out again
+        i = self.registry.get("name_cursor", 0)
+        while True:
+            i += 1
+            name = f"cell-{i:02d}"
+            if name not in cells:
+                self.registry["name_cursor"] = i
                 return name
-        # Fallback to numbered cells
-        i = len(used) + 1
-        return f"cell-{i:02d}"
 
     def _get_next_port(self) -> int:
-        """Get next available port."""
+        """Get next available port, reusing ones handed back first."""
+        free = self.registry.get("free_ports")
+        if free:
+            return free.pop(0)
         port = self.registry["next_port"]
         self.registry["next_port"] = port + 1
         return port
@@ -109,150 +407,327 @@ class CellBirther:
             name: Cell name (auto-assigned if None)
             port: Port to expose (auto-assigned if None)
             skip_core_build: Skip C++ native engine compilation
-            network: Docker network to join
+            network: Docker network to join ("host" binds the host port
+                directly, with no published ports or docker-proxy)
 
         Returns:
             Cell identity dict
         """
-        name = name or self._get_next_cell_name()
-        port = port or self._get_next_port()
-
-        print(f"🧬 Birthing cell: {name} on port {port}")
-
-        # Create cell config using canonical aios-schema types
-        # AINLP.schema[VALIDATE] Ensures parameters match CellConfig contract
-        cell_config = CellConfig(
-            name=name,
-            port=port,
-            environment={
-                "AIOS_CELL_ID": name,
-                "AIOS_BRANCH": "main",
-                "SKIP_CORE_BUILD": "1" if skip_core_build else "0",
-                "PYTHONPATH": "/app",
-            },
-            networks=[network],
-            skip_core_build=skip_core_build,
-        )
-        # AINLP.loader[latent:cell_config] Reserved for orchestration
-        _ = cell_config  # Schema validation complete, future use
+        plan = self._reserve([{"name": name, "port": port}], network)
+        name, port, _, pooled_id = plan[0]
+        results: List[dict] = []
+
+        # Whatever raises below, the reservation is released by _commit
+        try:
+            print(f"🧬 Birthing cell: {name} on port {port}")
+
+            # Create cell config using canonical aios-schema types
+            # AINLP.schema[VALIDATE] Ensures parameters match CellConfig contract
+            CellConfig, _ = _schema()
+            cell_config = CellConfig(
+                name=name,
+                port=port,
+                environment={
+                    "AIOS_CELL_ID": name,
+                    "AIOS_BRANCH": "main",
+                    "SKIP_CORE_BUILD": "1" if skip_core_build else "0",
+                    "PYTHONPATH": "/app",
+                },
+                networks=[network],
+                skip_core_build=skip_core_build,
+            )
+            # AINLP.loader[latent:cell_config] Reserved for orchestration
+            _ = cell_config  # Schema validation complete, future use
 
-        # Check if network exists, create if not
-        self._ensure_network(network)
+            # Check if network exists, create if not
+            self._ensure_network(network)
+
+            # Build image if needed
+            self._build_image(skip_core_build)
+
+            results.append(
+                self._spawn(name, port, skip_core_build, network, pooled_id)
+            )
+        finally:
+            # Update registry
+            self._commit(plan, results)
+
+        return results[0]
+
+    def birth_many(
+        self,
+        specs: List[dict],
+        skip_core_build: bool = True,
+        network: str = "aios-mesh",
+    ) -> List[dict]:
+        """
+        Birth several cells concurrently.
+
+        Names and ports are reserved in one locked registry mutation, the
+        network and image are prepared once, then the container runs are
+        issued in parallel and the outcomes committed in a second mutation.
 
-        # Build image if needed
-        self._build_image(skip_core_build)
+        Args:
+            specs: One dict per cell with optional "name" and "port" keys
+            skip_core_build: Skip C++ native engine compilation
+            network: Docker network to join
 
-        # Run container
+        Returns:
+            Cell identity dicts (or {"error": ...}) in spec order
+        """
+        plan = self._reserve(specs, network)
+        results: List[dict] = []
+
+        # Whatever raises below, unreached reservations are released
+        try:
+            print(f"🧬 Birthing {len(plan)} cells: {', '.join(p[0] for p in plan)}")
+            self._ensure_network(network)
+            self._build_image(skip_core_build)
+
+            workers = max(1, min(BIRTH_WORKERS, len(plan)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._spawn, p[0], p[1], skip_core_build, network, p[3])
+                    for p in plan
+                ]
+                # One failed spawn must not drop the others' results
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append({"error": str(e)})
+        finally:
+            self._commit(plan, results)
+        return results
+
+    def _spawn(
+        self,
+        name: str,
+        port: int,
+        skip_core_build: bool,
+        network: str,
+        pooled_id: Optional[str] = None,
+    ) -> dict:
+        """Run one cell container and return its identity dict."""
         container_name = f"aios-cell-{name}"
-        env_args = [
-            "-e",
-            f"AIOS_CELL_ID={name}",
-            "-e",
-            "AIOS_BRANCH=main",
-            "-e",
-            f"SKIP_CORE_BUILD={'1' if skip_core_build else '0'}",
-            "-e",
-            "PYTHONPATH=/app",
-        ]
-
-        cmd = [
-            "docker",
-            "run",
-            "-d",
-            "--name",
-            container_name,
-            "--network",
-            network,
-            "-p",
-            f"{port}:8000",
-            "-p",
-            f"{port + 1000}:9091",  # Metrics port
-            *env_args,
-            "--restart",
-            "unless-stopped",
-            "aios-cell:latest",
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-        if result.returncode != 0:
-            print(f"❌ Failed to birth cell: {result.stderr}")
-            return {"error": result.stderr}
-
-        container_id = result.stdout.strip()[:12]
+        environment = {
+            "AIOS_CELL_ID": name,
+            "AIOS_BRANCH": "main",
+            "SKIP_CORE_BUILD": "1" if skip_core_build else "0",
+            "PYTHONPATH": "/app",
+        }
+        if network == HOST_NETWORK:
+            # No port mapping on the host network; the server binds `port`
+            environment["PORT"] = str(port)
+        # Resolved before any container exists, so a schema failure
+        # cannot leave a running container unrecorded
+        _, CellIdentity = _schema()
+        try:
+            if pooled_id is not None:
+                # Warm start: namespaces, network and ports already exist
+                container = self.client.containers.get(pooled_id)
+                container.rename(container_name)
+                container.exec_run(
+                    ["python", "cell_server.py"],
+                    detach=True,
+                    environment=environment,
+                )
+            elif network == HOST_NETWORK:
+                container = self.client.containers.run(
+                    "aios-cell:latest",
+                    name=container_name,
+                    detach=True,
+                    network_mode=HOST_NETWORK,
+                    environment=environment,
+                    restart_policy={"Name": "unless-stopped"},
+                )
+            else:
+                container = self.client.containers.run(
+                    "aios-cell:latest",
+                    name=container_name,
+                    detach=True,
+                    network=network,
+                    ports={
+                        "8000/tcp": port,
+                        "9091/tcp": port + 1000,  # Metrics port
+                    },
+                    environment=environment,
+                    restart_policy={"Name": "unless-stopped"},
+                )
+        except (DockerException, RequestException) as e:
+            reason = getattr(e, "explanation", None) or e
+            print(f"❌ Failed to birth cell {name}: {reason}")
+            return {"error": str(reason)}
+
+        container_id = container.id[:12]
 
         # Create identity using canonical aios-schema types
         identity = CellIdentity(name=name, host="localhost", port=port, version="0.1.0")
         identity_dict = identity.to_dict()
         # Add runtime metadata
-        identity_dict["birth_time"] = datetime.now().isoformat()
+        identity_dict["birth_time_ns"] = time.time_ns()  # Epoch ns; sortable
         identity_dict["container_id"] = container_id
 
-        # Update registry
+        print(f"✅ Cell {name} born: http://localhost:{port}")
+        print(f"   Container: {container_id}")
+        if network != HOST_NETWORK:
+            print(f"   Metrics: http://localhost:{port + 1000}")
+
+        return identity_dict
+
+    def _record(self, name: str, identity_dict: dict):
+        """Insert a born cell into the in-memory registry."""
         self.registry["cells"][name] = {
             **identity_dict,
-            "container_id": container_id,
             "status": "healthy",
         }
-        self._save_registry()
 
-        print(f"✅ Cell {name} born: http://localhost:{port}")
-        print(f"   Container: {container_id}")
-        print(f"   Metrics: http://localhost:{port + 1000}")
+    def fill_pool(self, size: int = POOL_SIZE, network: str = "aios-mesh") -> int:
+        """
+        Top the warm pool up to size idle containers on network.
 
-        return identity_dict
+        Pool containers run the cell image with an idle command and their
+        ports already published; birth() adopts one by renaming it and
+        exec'ing the cell server, skipping container create/start. An
+        adopted cell's server does not survive a container restart.
+
+        Returns:
+            Number of containers started
+        """
+
+        def allocate(registry: dict):
+            pool = registry.setdefault("pool", [])
+            missing = size - sum(1 for p in pool if p["network"] == network)
+            return [self._get_next_port() for _ in range(max(missing, 0))]
+
+        if network == HOST_NETWORK:
+            print("⚠️  Warm pool needs published ports; not available on host network")
+            return 0
+
+        ports = self._mutate_registry(allocate)
+        if not ports:
+            return 0
+
+        self._ensure_network(network)
+        self._build_image(True)
+
+        def start(port: int) -> Optional[dict]:
+            name = f"aios-pool-{port}"
+            try:
+                # init: an idle `sleep` as PID 1 ignores SIGTERM and never
+                # reaps the cell server exec'd in on adoption
+                container = self.client.containers.run(
+                    "aios-cell:latest",
+                    ["sleep", "infinity"],
+                    name=name,
+                    detach=True,
+                    init=True,
+                    network=network,
+                    ports={"8000/tcp": port, "9091/tcp": port + 1000},
+                )
+            except (DockerException, RequestException) as e:
+                reason = getattr(e, "explanation", None) or e
+                print(f"❌ Failed to start pool container: {reason}")
+                # run() may have created the container before start failed
+                try:
+                    self.client.containers.get(name).remove(force=True)
+                except (DockerException, RequestException):
+                    pass
+                return None
+            return {"container_id": container.id, "port": port, "network": network}
+
+        with ThreadPoolExecutor(max_workers=min(BIRTH_WORKERS, len(ports))) as pool:
+            outcomes = list(pool.map(start, ports))
+        started = [p for p in outcomes if p is not None]
+        failed = [port for port, p in zip(ports, outcomes) if p is None]
+
+        def record(registry: dict):
+            registry.setdefault("pool", []).extend(started)
+            # Hand unused ports back rather than leaking them
+            if failed:
+                free = registry.setdefault("free_ports", [])
+                free.extend(failed)
+                free.sort()
+
+        self._mutate_registry(record)
+        print(f"♨️  Warm pool: +{len(started)} on {network}")
+        return len(started)
 
     def _ensure_network(self, network: str):
-        """Ensure Docker network exists."""
-        result = subprocess.run(
-            ["docker", "network", "inspect", network], capture_output=True, check=False
-        )
-        if result.returncode != 0:
+        """
+        Ensure Docker network exists.
+
+        Bridge networks publish each cell's two ports through dockerd. With
+        the default userland proxy that is one docker-proxy process per
+        port; setting "userland-proxy": false in daemon.json leaves the
+        forwarding to iptables DNAT instead. The built-in "host" network
+        (--host-network) avoids port publishing altogether.
+        """
+        if network in self._known_networks:
+            return
+        # Name-filtered listing returns summary rows only, not the full
+        # inspect body (IPAM, attached containers) that networks.get fetches.
+        # The daemon's name filter is a substring match, hence the compare.
+        found = self.client.networks.list(names=[network])
+        if not any(n.name == network for n in found):
             print(f"🔗 Creating network: {network}")
-            subprocess.run(["docker", "network", "create", network], check=False)
+            self.client.networks.create(network)
+        self._known_networks.add(network)
 
     def _build_image(self, _skip_core_build: bool):
         """Build cell image if needed."""
         # Note: _skip_core_build reserved for future use (native core)
-        # Check if image exists
-        result = subprocess.run(
-            ["docker", "images", "-q", "aios-cell:latest"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        if self._image_cached:
+            return
 
-        if not result.stdout.strip():
-            print("🔨 Building cell image...")
-            dockerfile = self.cells_dir / "beta" / "Dockerfile.cell"
-
-            if not dockerfile.exists():
-                print(f"❌ Dockerfile not found: {dockerfile}")
-                return
-
-            # Build from workspace root
-            cmd = [
-                "docker",
-                "build",
-                "-f",
-                str(dockerfile),
-                "-t",
-                "aios-cell:latest",
-                str(self.workspace_root / "aios-win"),  # Build context
-            ]
-            subprocess.run(cmd, cwd=self.workspace_root, check=False)
+        # Check if image exists
+        try:
+            self.client.images.get("aios-cell:latest")
+            self._image_cached = True
+            return
+        except ImageNotFound:
+            pass
+
+        print("🔨 Building cell image...")
+        dockerfile = self.cells_dir / "beta" / "Dockerfile.cell"
+
+        if not dockerfile.exists():
+            print(f"❌ Dockerfile not found: {dockerfile}")
+            return
+
+        # Dockerfile lives outside the context; the SDK ships it alongside.
+        # Progress is streamed as dockerd emits it rather than buffered.
+        try:
+            for chunk in self.client.api.build(
+                path=str(self.workspace_root / "aios-win"),  # Build context
+                dockerfile=str(dockerfile),
+                tag="aios-cell:latest",
+                rm=True,
+                decode=True,
+            ):
+                if "error" in chunk:
+                    raise BuildError(chunk["error"], build_log=[chunk])
+                line = chunk.get("stream", "").rstrip()
+                if line:
+                    print(f"   {line}")
+        except (BuildError, APIError) as e:
+            print(f"❌ Image build failed: {e}")
+            return
+        self._image_cached = True
 
     def list_cells(self) -> list:
         """List all registered cells."""
+        # One `docker ps -a` for every cell container; sparse skips the
+        # per-container inspect the SDK otherwise issues behind the listing
+        states = {
+            c.attrs["Names"][0].lstrip("/"): c.attrs.get("State", "unknown")
+            for c in self.client.containers.list(
+                all=True, sparse=True, filters={"name": "aios-cell-"}
+            )
+        }
         cells = []
         for name, info in self.registry["cells"].items():
-            # Check actual status
-            result = subprocess.run(
-                ["docker", "inspect", f"aios-cell-{name}"],
-                capture_output=True,
-                check=False,
-            )
-            status = "running" if result.returncode == 0 else "stopped"
+            status = states.get(f"aios-cell-{name}", "stopped")
             cells.append(
                 {
                     "name": name,
@@ -265,24 +740,44 @@ class CellBirther:
 
     def kill(self, name: str) -> bool:
         """Kill a cell (stop and remove container)."""
-        container_name = f"aios-cell-{name}"
+        return self.kill_many([name]) == [name]
 
-        # Stop
-        subprocess.run(
-            ["docker", "stop", container_name], capture_output=True, check=False
-        )
-        # Remove
-        result = subprocess.run(
-            ["docker", "rm", container_name], capture_output=True, check=False
-        )
+    def kill_many(self, names: List[str]) -> List[str]:
+        """
+        Kill several cells: stop/remove in parallel, one registry mutation.
 
-        if result.returncode == 0:
-            if name in self.registry["cells"]:
-                del self.registry["cells"][name]
-                self._save_registry()
-            print(f"💀 Cell {name} terminated")
+        Returns:
+            Names of the cells that were terminated
+        """
+
+        def terminate(name: str) -> bool:
+            try:
+                container = self.client.containers.get(f"aios-cell-{name}")
+                container.stop()
+                container.remove()
+            except NotFound:
+                return False
+            except (DockerException, RequestException) as e:
+                reason = getattr(e, "explanation", None) or e
+                print(f"❌ Failed to terminate cell {name}: {reason}")
+                return False
             return True
-        return False
+
+        if not names:
+            return []
+        workers = max(1, min(BIRTH_WORKERS, len(names)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            killed = [n for n, ok in zip(names, pool.map(terminate, names)) if ok]
+
+        def remove(registry: dict):
+            for name in killed:
+                registry["cells"].pop(name, None)
+
+        if killed:
+            self._mutate_registry(remove)
+        for name in killed:
+            print(f"💀 Cell {name} terminated")
+        return killed
 
 
 def main():
@@ -291,14 +786,34 @@ def main():
 
     Actions:
         birth: Spawn a new AIOS cell container
+        birth-batch: Spawn several cells in parallel from a JSON spec list
+        pool:  Pre-start idle containers for warm births (--size)
         list:  Show all registered cells and their status
-        kill:  Terminate a cell by name
+        kill:  Terminate cells by --name, --names a,b,c or --all
     """
     parser = argparse.ArgumentParser(description="AIOS Cell Birth Automation")
-    parser.add_argument("action", choices=["birth", "list", "kill"])
+    parser.add_argument(
+        "action", choices=["birth", "birth-batch", "pool", "list", "kill"]
+    )
     parser.add_argument("--name", help="Cell name (auto if not provided)")
+    parser.add_argument("--names", help="Comma-separated cell names for kill")
+    parser.add_argument(
+        "--all", action="store_true", help="Kill every registered cell"
+    )
     parser.add_argument("--port", type=int, help="Port to expose")
     parser.add_argument("--with-core", action="store_true", help="Build C++ core")
+    parser.add_argument(
+        "--host-network",
+        action="store_true",
+        help="Run on the host network (no published ports / docker-proxy)",
+    )
+    parser.add_argument(
+        "--specs",
+        help='birth-batch JSON file ([{"name": ..., "port": ...}, ...]; "-" = stdin)',
+    )
+    parser.add_argument(
+        "--size", type=int, default=POOL_SIZE, help="Warm pool size for pool action"
+    )
 
     args = parser.parse_args()
 
@@ -306,12 +821,37 @@ def main():
     workspace_root = Path(__file__).parent.parent.parent.parent
 
     birther = CellBirther(workspace_root)
+    network = HOST_NETWORK if args.host_network else "aios-mesh"
 
     if args.action == "birth":
         result = birther.birth(
-            name=args.name, port=args.port, skip_core_build=not args.with_core
+            name=args.name,
+            port=args.port,
+            skip_core_build=not args.with_core,
+            network=network,
         )
         print(json.dumps(result, indent=2, default=str))
+        if POOL_SIZE and network != HOST_NETWORK:
+            birther.fill_pool()  # Replenish after the result is out
+
+    elif args.action == "birth-batch":
+        if not args.specs:
+            print("❌ --specs required for birth-batch action")
+            sys.exit(1)
+        if args.specs == "-":
+            specs = json.load(sys.stdin)
+        else:
+            with open(args.specs, encoding="utf-8") as f:
+                specs = json.load(f)
+        results = birther.birth_many(
+            specs, skip_core_build=not args.with_core, network=network
+        )
+        print(json.dumps(results, indent=2, default=str))
+        if POOL_SIZE and network != HOST_NETWORK:
+            birther.fill_pool()
+
+    elif args.action == "pool":
+        birther.fill_pool(args.size)
 
     elif args.action == "list":
         cells = birther.list_cells()
@@ -329,10 +869,16 @@ def main():
             print("No cells registered")
 
     elif args.action == "kill":
-        if not args.name:
-            print("❌ --name required for kill action")
+        if args.all:
+            names = list(birther.registry["cells"])
+        elif args.names:
+            names = [n.strip() for n in args.names.split(",") if n.strip()]
+        elif args.name:
+            names = [args.name]
+        else:
+            print("❌ --name, --names or --all required for kill action")
             sys.exit(1)
-        birther.kill(args.name)
+        birther.kill_many(names)
 
 
 if __name__ == "__main__":
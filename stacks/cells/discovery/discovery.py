@@ -24,12 +24,16 @@ Architecture:
 
 import asyncio
 import importlib.util
+import ipaddress
+import json
 import logging
 import os
 import socket
+import struct
 import subprocess
 import sys
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, Iterable, List, Tuple
 
 # Configure logging early
 logging.basicConfig(
@@ -42,33 +46,45 @@ logger = logging.getLogger("AIOS.Discovery")
 # AINLP.dendritic: Robust import with multiple fallback strategies
 def _import_dendritic_utils():
     """Import shared utilities with fallback strategies."""
-    # Strategy 1: Try relative import (when run as package)
-    try:
-        # pylint: disable=import-outside-toplevel
-        from ...shared.dendritic_utils import (
-            DendriticFrameworkDetector as _Detector,
-            get_base_model as _get_model,
-        )
-        return _Detector, _get_model
-    except ImportError:
-        pass
+    # Pick the strategy up front instead of letting failed imports
+    # walk sys.path: relative only inside the stacks package, absolute
+    # only if shared/ is actually on disk next to this cell
+    stacks_dir = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    in_package = (__package__ or "").count(".") >= 2
+    has_shared = os.path.isfile(
+        os.path.join(stacks_dir, "shared", "dendritic_utils.py")
+    )
+
+    # Strategy 1: Relative import (when run as package)
+    if in_package:
+        try:
+            # pylint: disable=import-outside-toplevel
+            from ...shared.dendritic_utils import (
+                DendriticFrameworkDetector as _Detector,
+                get_base_model as _get_model,
+                json_body as _json_body,
+            )
+            return _Detector, _get_model, _json_body
+        except ImportError:
+            pass
 
-    # Strategy 2: Try absolute import with adjusted path
-    try:
-        stacks_dir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        if stacks_dir not in sys.path:
-            sys.path.insert(0, stacks_dir)
+    # Strategy 2: Absolute import with adjusted path
+    if has_shared:
+        try:
+            if stacks_dir not in sys.path:
+                sys.path.insert(0, stacks_dir)
 
-        # pylint: disable=import-outside-toplevel
-        from shared.dendritic_utils import (
-            DendriticFrameworkDetector as _Detector,
-            get_base_model as _get_model,
-        )
-        return _Detector, _get_model
-    except ImportError:
-        pass
+            # pylint: disable=import-outside-toplevel
+            from shared.dendritic_utils import (
+                DendriticFrameworkDetector as _Detector,
+                get_base_model as _get_model,
+                json_body as _json_body,
+            )
+            return _Detector, _get_model, _json_body
+        except ImportError:
+            pass
 
     # Strategy 3: Inline fallback
     logger.warning("AINLP.dendritic: Using inline fallback utilities")
@@ -111,11 +127,28 @@ def _import_dendritic_utils():
         except ImportError:
             return _FallbackBaseModel
 
-    return _FallbackDetector, _fallback_get_base_model
+    def _fallback_json_body(model: Any) -> Any:
+        """FastAPI dependency: validate the raw body with pydantic-core."""
+        # pylint: disable=import-outside-toplevel
+        from fastapi import Request
+        from fastapi.exceptions import RequestValidationError
+        from pydantic import ValidationError
+
+        async def _decode(request: Request) -> Any:
+            try:
+                return model.model_validate_json(await request.body())
+            except ValidationError as e:
+                raise RequestValidationError([
+                    {**err, "loc": ("body", *err["loc"])}
+                    for err in e.errors(include_url=False)
+                ]) from e
+        return _decode
+
+    return _FallbackDetector, _fallback_get_base_model, _fallback_json_body
 
 
 # Initialize shared utilities
-DendriticFrameworkDetector, get_base_model = _import_dendritic_utils()
+DendriticFrameworkDetector, get_base_model, json_body = _import_dendritic_utils()
 
 # AINLP.dendritic growth: Framework detection
 detector = DendriticFrameworkDetector()
@@ -124,19 +157,25 @@ PYDANTIC_AVAILABLE = detector.is_available('pydantic')
 UVICORN_AVAILABLE = detector.is_available('uvicorn')
 AIOHTTP_AVAILABLE = detector.is_available('aiohttp')
 YAML_AVAILABLE = detector.is_available('yaml')
+AIODNS_AVAILABLE = detector.is_available('aiodns')
+ORJSON_AVAILABLE = detector.is_available('orjson')
+UVLOOP_AVAILABLE = detector.is_available('uvloop')
 
 # AINLP.dendritic: Conditional imports with type stubs
 # These are class placeholders, not constants - disable invalid-name
 FastAPI = None  # pylint: disable=invalid-name
 HTTPException = None  # pylint: disable=invalid-name
-uvicorn = None  # pylint: disable=invalid-name
+Depends = None  # pylint: disable=invalid-name
 aiohttp = None  # pylint: disable=invalid-name
-yaml = None  # pylint: disable=invalid-name
+orjson = None  # pylint: disable=invalid-name
+Response = None  # pylint: disable=invalid-name
+_JSONResponse = None  # pylint: disable=invalid-name
 BaseModel: Any = get_base_model()
 
 if FASTAPI_AVAILABLE:
     # pylint: disable=import-error
-    from fastapi import FastAPI, HTTPException  # type: ignore
+    from fastapi import Depends, FastAPI, HTTPException  # type: ignore
+    from fastapi.responses import Response  # type: ignore
     # pylint: enable=import-error
     logger.info("AINLP.dendritic: FastAPI active")
 else:
@@ -147,9 +186,10 @@ if PYDANTIC_AVAILABLE:
 else:
     logger.warning("AINLP.dendritic: Pydantic unavailable, using fallback")
 
-if UVICORN_AVAILABLE:
-    import uvicorn  # type: ignore  # pylint: disable=import-error
-else:
+# uvicorn and PyYAML are imported where used (serving, reading
+# hosts.yaml), so importing this module for HostRegistry or CellInfo
+# does not load them
+if not UVICORN_AVAILABLE:
     logger.warning("AINLP.dendritic: Uvicorn unavailable")
 
 if AIOHTTP_AVAILABLE:
@@ -157,23 +197,207 @@ if AIOHTTP_AVAILABLE:
 else:
     logger.warning("AINLP.dendritic: aiohttp unavailable")
 
-if YAML_AVAILABLE:
-    import yaml  # type: ignore  # pylint: disable=import-error
-else:
+if not YAML_AVAILABLE:
     logger.warning("AINLP.dendritic: PyYAML unavailable")
 
+if ORJSON_AVAILABLE:
+    import orjson  # type: ignore  # pylint: disable=import-error
+
+if FASTAPI_AVAILABLE:
+    # Route dicts serialized by orjson when installed
+    # pylint: disable=import-error
+    from fastapi.responses import JSONResponse, ORJSONResponse  # type: ignore
+    _JSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _model_dict(model: Any) -> Dict[str, Any]:
+    """Plain dict from a Pydantic v2/v1 model or the fallback model."""
+    dump = getattr(model, "model_dump", None)
+    return dump() if dump is not None else model.dict()
+
+
+# Raw TCP connect budget used to rule out dead targets before any HTTP
+TCP_PROBE_TIMEOUT = float(os.getenv("AIOS_TCP_PROBE_TIMEOUT", "0.2"))
+
+# Hostname resolutions (mDNS .local names included) are reused this long,
+# both by the TCP pre-probe and by the aiohttp connector
+DNS_CACHE_TTL = 300
+DNS_RESOLVE_TIMEOUT = 2.0
+_dns_cache: Dict[str, Tuple[float, str]] = {}
+
+
+async def _resolve(host: str) -> str:
+    """Resolve host to an address, cached for DNS_CACHE_TTL seconds."""
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+    now = time.monotonic()
+    cached = _dns_cache.get(host)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    infos = await asyncio.wait_for(
+        asyncio.get_running_loop().getaddrinfo(
+            host, None, type=socket.SOCK_STREAM
+        ),
+        DNS_RESOLVE_TIMEOUT
+    )
+    address = infos[0][4][0]
+    _dns_cache[host] = (now + DNS_CACHE_TTL, address)
+    return address
+
+
+async def _tcp_alive(host: str, port: int,
+                     timeout: float = TCP_PROBE_TIMEOUT) -> bool:
+    """True if host:port accepts a TCP connection within timeout."""
+    try:
+        # Resolution has its own budget so a slow first mDNS lookup does
+        # not read as a dead host
+        address = await _resolve(host)
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(address, port), timeout
+        )
+    except (asyncio.TimeoutError, OSError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
 
-class CellInfo(BaseModel):
-    """AINLP.dendritic: Cell information model for peer discovery."""
+# A target that answered within this window is not re-probed; failed
+# registration with it expires the entry early
+PEER_FRESH_S = float(os.getenv("AIOS_PEER_FRESH_S", "90"))
+# Peer cache persisted across restarts; {cell_id} and {port} keep
+# instances sharing a home directory from overwriting each other's cache
+PEER_CACHE_PATH = os.getenv(
+    "AIOS_PEER_CACHE", "~/.aios/peers-{cell_id}-{port}.json"
+)
+
+
+# Unreachable targets back off exponentially: after n consecutive failed
+# probes a target is skipped for min(BASE * 2**(n-1), MAX) seconds
+PROBE_BACKOFF_BASE_S = float(os.getenv("AIOS_PROBE_BACKOFF_BASE_S", "30"))
+PROBE_BACKOFF_MAX_S = float(os.getenv("AIOS_PROBE_BACKOFF_MAX_S", "600"))
+
+# Concurrent registration POSTs per round
+REGISTER_CONCURRENCY = 10
+
+# Concurrent probes (TCP pre-probe + /health) per scan; bounds open
+# sockets however long the target list grows
+PROBE_CONCURRENCY = int(os.getenv("AIOS_PROBE_CONCURRENCY", "8"))
+
+# Gossip: peers not heard from (directly or via another peer's /peers)
+# for this many discovery cycles are evicted
+GOSSIP_EVICT_CYCLES = int(os.getenv("AIOS_GOSSIP_EVICT_CYCLES", "3"))
+
+# LAN multicast discovery: one hello to the group, cells answer unicast.
+# Site-local group, TTL 1 (never leaves the subnet); AIOS_MCAST=0 disables
+MCAST_ENABLED = os.getenv("AIOS_MCAST", "1") != "0"
+MCAST_GROUP = os.getenv("AIOS_MCAST_GROUP", "239.255.42.42")
+MCAST_PORT = int(os.getenv("AIOS_MCAST_PORT", "8999"))
+MCAST_WAIT_S = 0.5
+
+
+class _McastResponder(asyncio.DatagramProtocol):
+    """Answers multicast hellos from other cells with this cell's info."""
+
+    def __init__(self, discovery: "AIOSDiscovery") -> None:
+        self.discovery = discovery
+        self.transport: Any = None
+
+    def connection_made(self, transport: Any) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        try:
+            hello = _json_loads(data)
+        except ValueError:
+            return
+        if (not isinstance(hello, dict) or hello.get("msg") != "hello"
+                or hello.get("cell_id") == self.discovery.cell_id):
+            return
+        self.transport.sendto(self.discovery.multicast_reply(), addr)
+
+
+class _McastCollector(asyncio.DatagramProtocol):
+    """Collects unicast replies to one multicast hello."""
+
+    def __init__(self) -> None:
+        self.replies: List[Tuple[Dict[str, Any], str]] = []
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        try:
+            reply = _json_loads(data)
+        except ValueError:
+            return
+        if isinstance(reply, dict) and reply.get("msg") == "here":
+            self.replies.append((reply, addr[0]))
+
+
+_CELL_FIELDS = (
+    "cell_id", "ip", "port", "consciousness_level",
+    "services", "branch", "type", "hostname",
+)
+
+if PYDANTIC_AVAILABLE:
+    class CellInfo(BaseModel):
+        """AINLP.dendritic: Cell information model for peer discovery."""
+
+        cell_id: str
+        ip: str
+        port: int
+        consciousness_level: float = 0.0
+        services: List[str] = []
+        branch: str = "main"
+        type: str = "cell"
+        hostname: str = ""
+else:
+    class CellInfo:  # type: ignore[no-redef]
+        """
+        AINLP.dendritic: Slotted CellInfo for pydantic-less nodes.
+
+        Same fields and defaults as the model; no per-instance __dict__,
+        so the peer table stays small on low-memory hosts.
+        """
+
+        __slots__ = _CELL_FIELDS
+
+        # pylint: disable-next=redefined-builtin
+        def __init__(self, cell_id: str, ip: str, port: int,
+                     consciousness_level: float = 0.0,
+                     services: List[str] | None = None,
+                     branch: str = "main", type: str = "cell",
+                     hostname: str = "") -> None:
+            self.cell_id = cell_id
+            self.ip = ip
+            self.port = port
+            self.consciousness_level = consciousness_level
+            self.services = services if services is not None else []
+            self.branch = branch
+            self.type = type
+            self.hostname = hostname
 
-    cell_id: str
-    ip: str
-    port: int
-    consciousness_level: float = 0.0
-    services: List[str] = []
-    branch: str = "main"
-    type: str = "cell"
-    hostname: str = ""
+        def dict(self) -> Dict[str, Any]:
+            """Return the cell info as a dictionary."""
+            return {f: getattr(self, f) for f in _CELL_FIELDS}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -273,10 +497,12 @@ class HostRegistry:
             self._load_defaults()
             return
 
-        if yaml is None:
+        if not YAML_AVAILABLE:
             logger.error("AINLP.dendritic: PyYAML required for host registry")
             self._load_defaults()
             return
+        # pylint: disable-next=import-outside-toplevel,import-error
+        import yaml  # type: ignore
 
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
@@ -432,10 +658,77 @@ class AIOSDiscovery:
         self.listen_port = listen_port
         self.peers: Dict[str, CellInfo] = {}
         self.app: Any = None
+        self._session: Any = None
+        # "target:port" -> (wall-clock seen, cell_id)
+        self._last_seen: Dict[str, Tuple[float, str]] = {}
+        # (target, port) -> (consecutive failures, monotonic next-try time)
+        self._backoff: Dict[Tuple[str, int], Tuple[int, float]] = {}
+        # Gossip heartbeat: cell_id -> discovery cycle it was last heard in
+        self._cycle = 0
+        self._heard: Dict[str, int] = {}
+        # Encoded /peers body; None after any change to self.peers
+        self._peers_body: bytes | None = None
+        self._peer_cache_path = os.path.expanduser(PEER_CACHE_PATH.format(
+            cell_id="".join(
+                c if c.isalnum() or c in "-_." else "_" for c in cell_id
+            ),
+            port=listen_port,
+        ))
+        # Last cache body written (or loaded); unchanged cycles skip the write
+        self._peer_cache_saved: bytes | None = None
+        self._load_peer_cache()
 
         # AINLP.dendritic growth: Host registry integration
         self.registry = registry or HostRegistry()
 
+        # The registry is static once loaded: this cell's identity, its
+        # encoded registration payload and the scan targets are built once
+        self._my_info: Dict[str, Any] = self.registry.get_my_info()
+        self._my_info_payload = _json_bytes(
+            _model_dict(CellInfo(**self._my_info))
+        )
+        self._targets: Tuple[str, ...] = tuple(
+            self.registry.get_discovery_targets()
+        )
+        self._ports: Tuple[int, ...] = tuple(
+            self.registry.get_discovery_ports()
+        )
+        # Scan plan (target x port), localhost excluded so a cell never
+        # discovers itself; each scan just walks this tuple
+        self._probe_plan: Tuple[Tuple[str, int], ...] = tuple(
+            (target, port)
+            for target in self._targets
+            if target not in ("localhost", "127.0.0.1")
+            for port in self._ports
+        )
+        # Idle keep-alive outlasting one discovery cycle on both ends, so
+        # each peer's connection is reused across rounds, not re-dialed.
+        # The client gives up a few seconds before the server does, so it
+        # never reuses a connection the server is just closing
+        self._keepalive_s = self.registry.get_probe_interval() + 15
+        self._client_keepalive_s = self._keepalive_s - 5
+
+        # Request budgets, built once: connect fails fast on dead hosts,
+        # total bounds the whole exchange
+        self._probe_timeout: Any = None
+        # Wall-clock cap on one probe, so a scan ends within this bound
+        # whatever a single slow peer does
+        self._probe_deadline = min(2.0, self.registry.get_connection_timeout())
+        self._register_timeout: Any = None
+        if aiohttp is not None:
+            timeout = self.registry.get_connection_timeout()
+            # Per-phase budgets for probes: a peer that accepts the
+            # connection but stalls on the body gives up on sock_read
+            self._probe_timeout = aiohttp.ClientTimeout(
+                connect=min(0.5, timeout), sock_read=min(1.5, timeout)
+            )
+            self._register_timeout = aiohttp.ClientTimeout(
+                total=timeout + 2, connect=2
+            )
+
+        # Peer names only feed log lines; the registry is static
+        self._peer_names = tuple(h.name for h in self.registry.get_peer_hosts())
+
         # Log configuration
         if self.registry.current_host:
             logger.info(
@@ -443,12 +736,16 @@ class AIOSDiscovery:
                 self.registry.current_host.name,
                 self.registry.current_branch
             )
-            peer_names = [h.name for h in self.registry.get_peer_hosts()]
-            logger.info("AINLP.dendritic: Peers to discover: %s", peer_names)
+            logger.info(
+                "AINLP.dendritic: Peers to discover: %s", self._peer_names
+            )
 
         # AINLP.dendritic growth: Conditional app creation
         if FASTAPI_AVAILABLE and FastAPI is not None:
-            self.app = FastAPI(title="AIOS Discovery Service")
+            self.app = FastAPI(
+                title="AIOS Discovery Service",
+                default_response_class=_JSONResponse
+            )
             self._setup_routes()
         else:
             logger.warning(
@@ -464,7 +761,7 @@ class AIOSDiscovery:
         @self.app.get("/health")
         async def health_check() -> Dict[str, Any]:
             """Health check endpoint with host info."""
-            my_info = self.registry.get_my_info()
+            my_info = self._my_info
             return {
                 "status": "healthy",
                 "cell_id": self.cell_id,
@@ -478,7 +775,7 @@ class AIOSDiscovery:
         @self.app.get("/metrics")
         async def get_metrics():
             """Prometheus metrics endpoint for Discovery cell."""
-            my_info = self.registry.get_my_info()
+            my_info = self._my_info
             level = my_info.get("consciousness_level", 4.0)
             cell_id = self.cell_id
             peer_count = len(self.peers)
@@ -525,16 +822,19 @@ aios_cell_up{{cell_id="{cell_id}"}} 1
             )
 
         @self.app.get("/peers")
-        async def get_peers() -> Dict[str, Any]:
+        async def get_peers() -> Any:
             """Get all registered peers."""
             host_name = "unknown"
             if self.registry.current_host:
                 host_name = self.registry.current_host.name
-            return {
-                "peers": [p.dict() for p in self.peers.values()],
-                "count": len(self.peers),
-                "my_host": host_name
-            }
+            # Encoded once per change to self.peers, not per request
+            if self._peers_body is None:
+                self._peers_body = _json_bytes({
+                    "peers": [_model_dict(p) for p in self.peers.values()],
+                    "count": len(self.peers),
+                    "my_host": host_name
+                })
+            return Response(self._peers_body, media_type="application/json")
 
         @self.app.get("/hosts")
         async def get_hosts() -> Dict[str, Any]:
@@ -556,10 +856,20 @@ aios_cell_up{{cell_id="{cell_id}"}} 1
                 }
             }
 
+        # Body bytes validated by pydantic-core in one pass (v2 only)
+        register_body = (
+            Depends(json_body(CellInfo))
+            if hasattr(CellInfo, "model_validate_json") else ...
+        )
+
         @self.app.post("/register")
-        async def register_peer(peer: CellInfo) -> Dict[str, str]:
+        async def register_peer(
+            peer: CellInfo = register_body
+        ) -> Dict[str, str]:
             """Register a new peer."""
             self.peers[peer.cell_id] = peer
+            self._heard[peer.cell_id] = self._cycle
+            self._peers_body = None
             logger.info(
                 "Registered peer: %s at %s:%s (branch: %s)",
                 peer.cell_id, peer.ip, peer.port, peer.branch
@@ -571,93 +881,345 @@ aios_cell_up{{cell_id="{cell_id}"}} 1
             """Unregister a peer."""
             if cell_id in self.peers:
                 del self.peers[cell_id]
+                self._heard.pop(cell_id, None)
+                self._peers_body = None
                 logger.info("Unregistered peer: %s", cell_id)
                 return {"status": "unregistered"}
             if HTTPException is not None:
                 raise HTTPException(status_code=404, detail="Peer not found")
             raise ValueError("Peer not found")
 
+    def _load_peer_cache(self) -> None:
+        """Restore peers and last-seen times persisted by a previous run."""
+        try:
+            with open(self._peer_cache_path, "rb") as f:
+                raw = f.read()
+            cache = _json_loads(raw)
+            for data in cache.get("peers", []):
+                peer = CellInfo(**data)
+                self.peers[peer.cell_id] = peer
+            for key, (seen, cell_id) in cache.get("last_seen", {}).items():
+                self._last_seen[key] = (seen, cell_id)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning("AINLP.dendritic: Ignoring peer cache: %s", exc)
+            return
+        self._peer_cache_saved = raw
+        logger.info(
+            "AINLP.dendritic: Restored %d cached peer(s)", len(self.peers)
+        )
+
+    def _write_peer_cache(self, body: bytes) -> None:
+        path = self._peer_cache_path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+
+    async def _save_peer_cache(self) -> None:
+        """Persist peers and last-seen times off the event loop.
+
+        Skipped when neither has changed since the last write, so a quiet
+        network costs no disk I/O per cycle.
+        """
+        body = _json_bytes({
+            "peers": [_model_dict(p) for p in self.peers.values()],
+            "last_seen": self._last_seen,
+        })
+        if body == self._peer_cache_saved:
+            return
+        try:
+            await asyncio.to_thread(self._write_peer_cache, body)
+        except OSError as exc:
+            logger.warning("AINLP.dendritic: Peer cache not saved: %s", exc)
+            return
+        self._peer_cache_saved = body
+
+    def _forget(self, cell_id: str) -> None:
+        """Expire last-seen entries for a peer so the next scan re-probes it."""
+        for key in [k for k, v in self._last_seen.items() if v[1] == cell_id]:
+            del self._last_seen[key]
+
+    @property
+    def session(self) -> Any:
+        """Service-lifetime HTTP session shared by probes and registration."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=8,
+                    keepalive_timeout=self._client_keepalive_s,
+                    use_dns_cache=True,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    # c-ares resolver when aiodns is installed; otherwise
+                    # aiohttp's threaded getaddrinfo
+                    resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE
+                    else None
+                )
+            )
+        return self._session
+
+    async def close_session(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def _create_fallback_app(self) -> Dict[str, str]:
         """AINLP.dendritic: Create fallback app when FastAPI unavailable."""
         logger.warning("AINLP.dendritic: Using pure Python fallback app")
         return {"type": "fallback", "framework": "none"}
 
+    def multicast_reply(self) -> bytes:
+        """Datagram answering a multicast hello (mirrors /health)."""
+        my_info = self._my_info
+        return _json_bytes({
+            "msg": "here",
+            "cell_id": self.cell_id,
+            "port": self.listen_port,
+            "consciousness_level": my_info.get("consciousness_level", 0.0),
+            "services": my_info.get("services", []),
+            "branch": my_info.get("branch", "unknown"),
+            "type": my_info.get("type", "unknown"),
+            "hostname": my_info.get("hostname", ""),
+        })
+
+    async def _start_multicast_responder(self) -> Any:
+        """Join the discovery group; returns the transport, or None."""
+        if not MCAST_ENABLED:
+            return None
+        sock = None
+        try:
+            sock = socket.socket(
+                socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+            )
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind(("", MCAST_PORT))
+            mreq = struct.pack(
+                "4s4s", socket.inet_aton(MCAST_GROUP),
+                socket.inet_aton("0.0.0.0")
+            )
+            sock.setsockopt(
+                socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq
+            )
+            sock.setblocking(False)
+            transport, _ = await asyncio.get_running_loop(
+            ).create_datagram_endpoint(
+                lambda: _McastResponder(self), sock=sock
+            )
+        except OSError as exc:
+            if sock is not None:
+                sock.close()
+            logger.warning(
+                "AINLP.dendritic: Multicast responder unavailable: %s", exc
+            )
+            return None
+        logger.info(
+            "AINLP.dendritic: Multicast discovery on %s:%s",
+            MCAST_GROUP, MCAST_PORT
+        )
+        return transport
+
+    async def _multicast_discover(self) -> List[CellInfo]:
+        """Send one hello to the group and collect replies for a moment."""
+        sock = None
+        try:
+            sock = socket.socket(
+                socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+            )
+            sock.setsockopt(
+                socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1
+            )
+            sock.bind(("", 0))
+            sock.setblocking(False)
+            transport, collector = await asyncio.get_running_loop(
+            ).create_datagram_endpoint(_McastCollector, sock=sock)
+        except OSError as exc:
+            if sock is not None:
+                sock.close()
+            logger.debug("Multicast discovery unavailable: %s", exc)
+            return []
+
+        try:
+            transport.sendto(
+                _json_bytes({"msg": "hello", "cell_id": self.cell_id}),
+                (MCAST_GROUP, MCAST_PORT)
+            )
+            await asyncio.sleep(MCAST_WAIT_S)
+        except OSError as exc:
+            logger.debug("Multicast hello failed: %s", exc)
+        finally:
+            transport.close()
+
+        peers: Dict[str, CellInfo] = {}
+        now = time.time()
+        for reply, ip in collector.replies:
+            try:
+                peer = CellInfo(
+                    cell_id=reply["cell_id"],
+                    ip=ip,
+                    port=int(reply["port"]),
+                    consciousness_level=reply.get("consciousness_level", 0.0),
+                    services=reply.get("services", []),
+                    branch=reply.get("branch", "unknown"),
+                    type=reply.get("type", "unknown"),
+                    hostname=reply.get("hostname") or ip
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            peers.setdefault(peer.cell_id, peer)
+            self._last_seen[f"{ip}:{peer.port}"] = (now, peer.cell_id)
+            self._backoff.pop((ip, peer.port), None)
+        return list(peers.values())
+
     async def discover_peers(self) -> List[CellInfo]:
         """
         AINLP.dendritic(AIOS{growth}): Discover AIOS cells on network.
 
-        Uses host registry for branch-aware peer discovery.
+        Asks the LAN over multicast, then sweeps the branch-aware host
+        registry targets that did not answer. Multicast only adds to the
+        sweep: cells on other subnets, bridged containers and hosts that
+        filter multicast are still reached over unicast.
         """
         if not AIOHTTP_AVAILABLE or aiohttp is None:
             logger.warning("AINLP.dendritic: aiohttp unavailable")
             return []
 
-        discovered_peers: List[CellInfo] = []
-
-        # Get targets from host registry (branch-aware)
-        targets = self.registry.get_discovery_targets()
-        ports = self.registry.get_discovery_ports()
+        mcast_peers: List[CellInfo] = []
+        if MCAST_ENABLED:
+            mcast_peers = await self._multicast_discover()
+            if mcast_peers:
+                logger.debug(
+                    "AINLP.dendritic: %d peer(s) answered multicast",
+                    len(mcast_peers)
+                )
+        answered = set()
+        for peer in mcast_peers:
+            answered.add((peer.ip, peer.port))
+            answered.add((peer.hostname, peer.port))
+        plan = [a for a in self._probe_plan if a not in answered]
 
         logger.debug(
             "AINLP.dendritic: Probing %s on ports %s",
-            targets, ports
+            self._targets, self._ports
         )
+        swept = await self._probe_addresses(plan)
+
+        found = {p.cell_id: p for p in mcast_peers}
+        for peer in swept:
+            found.setdefault(peer.cell_id, peer)
+        return list(found.values())
+
+    async def _probe_addresses(
+        self, addresses: Iterable[Tuple[str, int]]
+    ) -> List[CellInfo]:
+        """
+        Probe (target, port) pairs concurrently; one CellInfo per cell.
 
-        for target in targets:
-            # Skip localhost self-discovery
-            if target in ["localhost", "127.0.0.1"]:
+        Targets seen within PEER_FRESH_S reuse the cached peer and
+        targets backing off from failed probes are skipped.
+        """
+        discovered_peers: List[CellInfo] = []
+        now = time.time()
+        mono = time.monotonic()
+        results: List[Any] = []
+        stale = []
+        for target, port in addresses:
+            seen = self._last_seen.get(f"{target}:{port}")
+            if (seen is not None and now - seen[0] < PEER_FRESH_S
+                    and seen[1] in self.peers):
+                results.append(self.peers[seen[1]])
                 continue
+            # Targets still backing off from failed probes sit this one out
+            backoff = self._backoff.get((target, port))
+            if backoff is not None and mono < backoff[1]:
+                continue
+            stale.append((target, port))
+
+        # Probes run concurrently, at most PROBE_CONCURRENCY at a time
+        sem = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+        async def _probe_one(target: str, port: int) -> CellInfo | None:
+            async with sem:
+                return await self._probe_target(target, port)
 
-            for port in ports:
-                peer = await self._probe_target(target, port)
-                if peer is not None:
-                    # Avoid duplicates
-                    ids = [p.cell_id for p in discovered_peers]
-                    if peer.cell_id not in ids:
-                        discovered_peers.append(peer)
+        results.extend(await asyncio.gather(
+            *(_probe_one(t, p) for t, p in stale),
+            return_exceptions=True
+        ))
+
+        seen = set()
+        for peer in results:
+            if isinstance(peer, CellInfo) and peer.cell_id not in seen:
+                # Avoid duplicates
+                seen.add(peer.cell_id)
+                discovered_peers.append(peer)
 
         return discovered_peers
 
     async def _probe_target(self, target: str, port: int) -> CellInfo | None:
         """Probe a target for AIOS cell presence."""
-        if aiohttp is None:
+        # Dead hosts fail here in TCP_PROBE_TIMEOUT, not the HTTP budget
+        if not await _tcp_alive(target, port):
+            self._probe_failed(target, port)
             return None
 
-        timeout = self.registry.get_connection_timeout()
-
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as session:
-                url = f"http://{target}:{port}/health"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        peer = CellInfo(
-                            cell_id=data.get("cell_id", f"unknown-{target}"),
-                            ip=target,
-                            port=port,
-                            consciousness_level=data.get(
-                                "consciousness_level", 0.0
-                            ),
-                            services=data.get("services", []),
-                            branch=data.get("branch", "unknown"),
-                            type=data.get("type", "unknown"),
-                            hostname=data.get("hostname", target)
-                        )
-
-                        logger.info(
-                            "AINLP.dendritic: Found '%s' at %s:%s (%.2f)",
-                            peer.cell_id, target, port,
-                            peer.consciousness_level
-                        )
-                        return peer
+            # wait_for cancels the request outright once the deadline hits
+            data = await asyncio.wait_for(
+                self._fetch_health(target, port),
+                timeout=self._probe_deadline
+            )
         except asyncio.TimeoutError:
             logger.debug("Timeout probing %s:%s", target, port)
+            data = None
         except (OSError, Exception) as exc:
             logger.debug("Failed to probe %s:%s - %s", target, port, exc)
-        return None
+            data = None
+        if data is None:
+            self._probe_failed(target, port)
+            return None
+        self._backoff.pop((target, port), None)
+
+        peer = CellInfo(
+            cell_id=data.get("cell_id", f"unknown-{target}"),
+            ip=target,
+            port=port,
+            consciousness_level=data.get("consciousness_level", 0.0),
+            services=data.get("services", []),
+            branch=data.get("branch", "unknown"),
+            type=data.get("type", "unknown"),
+            hostname=data.get("hostname", target)
+        )
+
+        logger.info(
+            "AINLP.dendritic: Found '%s' at %s:%s (%.2f)",
+            peer.cell_id, target, port, peer.consciousness_level
+        )
+        self._last_seen[f"{target}:{port}"] = (time.time(), peer.cell_id)
+        return peer
+
+    def _probe_failed(self, target: str, port: int) -> None:
+        """Count a failed probe and push the target's next attempt out."""
+        fails = self._backoff.get((target, port), (0, 0.0))[0] + 1
+        delay = min(PROBE_BACKOFF_BASE_S * 2 ** min(fails - 1, 16),
+                    PROBE_BACKOFF_MAX_S)
+        self._backoff[(target, port)] = (fails, time.monotonic() + delay)
+
+    async def _fetch_health(self, target: str,
+                            port: int) -> Dict[str, Any] | None:
+        """GET a target's /health body; None unless it answers 200."""
+        url = f"http://{target}:{port}/health"
+        async with self.session.get(
+            url, timeout=self._probe_timeout
+        ) as response:
+            if response.status != 200:
+                return None
+            return _json_loads(await response.read())
 
     async def register_with_peers(self, peers: List[CellInfo]) -> None:
         """Register this cell with discovered peers."""
@@ -665,61 +1227,139 @@ aios_cell_up{{cell_id="{cell_id}"}} 1
             logger.warning("AINLP.dendritic: aiohttp unavailable")
             return
 
-        my_info_dict = self.registry.get_my_info()
-        my_info = CellInfo(**my_info_dict)
+        # Encoded once at startup, posted as-is to every peer
+        payload = self._my_info_payload
 
-        for peer in peers:
-            if peer.cell_id == self.cell_id:
-                continue
-            await self._register_with_peer(peer, my_info)
+        # Fan out, bounded: a round costs ~ceil(N / 10) RTTs, not N
+        sem = asyncio.Semaphore(REGISTER_CONCURRENCY)
+
+        async def _register_one(peer: CellInfo) -> None:
+            async with sem:
+                await self._register_with_peer(peer, payload)
+
+        await asyncio.gather(
+            *(_register_one(p) for p in peers if p.cell_id != self.cell_id),
+            return_exceptions=True
+        )
 
     async def _register_with_peer(
-        self, peer: CellInfo, my_info: CellInfo
+        self, peer: CellInfo, payload: bytes
     ) -> None:
         """Register with a single peer."""
         if aiohttp is None:
             return
 
-        timeout = self.registry.get_connection_timeout() + 2
-
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as session:
-                url = f"http://{peer.ip}:{peer.port}/register"
-                async with session.post(
-                    url, json=my_info.dict()
-                ) as response:
-                    if response.status in [200, 201]:
-                        logger.info(
-                            "AINLP.dendritic: Registered with '%s'",
-                            peer.cell_id
-                        )
-                    else:
-                        logger.warning(
-                            "Failed to register with %s: %s",
-                            peer.cell_id, response.status
-                        )
-        except (OSError, asyncio.TimeoutError) as exc:
+            url = f"http://{peer.ip}:{peer.port}/register"
+            async with self.session.post(
+                url,
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=self._register_timeout
+            ) as response:
+                if response.status in [200, 201]:
+                    logger.info(
+                        "AINLP.dendritic: Registered with '%s'",
+                        peer.cell_id
+                    )
+                else:
+                    logger.warning(
+                        "Failed to register with %s: %s",
+                        peer.cell_id, response.status
+                    )
+                    self._forget(peer.cell_id)
+        except (
+            OSError, asyncio.TimeoutError, aiohttp.ClientError
+        ) as exc:
             logger.error(
                 "Error registering with %s: %s", peer.cell_id, exc
             )
+            self._forget(peer.cell_id)
+
+    async def _fetch_peer_view(self, peer: CellInfo) -> List[CellInfo]:
+        """GET a peer's /peers list (its view of the network)."""
+        try:
+            url = f"http://{peer.ip}:{peer.port}/peers"
+            async with self.session.get(
+                url, timeout=self._probe_timeout
+            ) as response:
+                if response.status != 200:
+                    return []
+                data = _json_loads(await response.read())
+        except (OSError, asyncio.TimeoutError, ValueError) as exc:
+            logger.debug("Gossip with %s failed: %s", peer.cell_id, exc)
+            return []
+        view = []
+        for entry in data.get("peers", []):
+            try:
+                view.append(CellInfo(**entry))
+            except (TypeError, ValueError):
+                continue
+        return view
+
+    async def _gossip(self, peers: List[CellInfo]) -> List[CellInfo]:
+        """
+        Merge the /peers views of directly reached peers (newscast).
+
+        Entries learned this way are only candidates: each is probed
+        directly, and only the ones that answer are returned. A dead cell
+        still listed in other cells' views therefore never counts as
+        heard and ages out instead of being kept alive by hearsay.
+        Cells reach each other transitively without every cell sweeping
+        every host.
+        """
+        own = {self.cell_id, self._my_info.get("cell_id")}
+        known = {p.cell_id for p in peers} | own
+        views = await asyncio.gather(
+            *(self._fetch_peer_view(p) for p in peers),
+            return_exceptions=True
+        )
+        learned: Dict[str, CellInfo] = {}
+        for view in views:
+            if isinstance(view, BaseException):
+                continue
+            for entry in view:
+                if entry.cell_id not in known:
+                    learned.setdefault(entry.cell_id, entry)
+        if not learned:
+            return []
+        confirmed = await self._probe_addresses(
+            dict.fromkeys((e.ip, e.port) for e in learned.values())
+        )
+        return [p for p in confirmed if p.cell_id not in known]
+
+    def _evict_silent(self) -> None:
+        """Drop peers not heard from for GOSSIP_EVICT_CYCLES cycles."""
+        for cell_id in list(self.peers):
+            heard = self._heard.setdefault(cell_id, self._cycle)
+            if self._cycle - heard > GOSSIP_EVICT_CYCLES:
+                del self.peers[cell_id]
+                del self._heard[cell_id]
+                self._peers_body = None
+                self._forget(cell_id)
+                logger.info("AINLP.dendritic: Evicted silent peer %s", cell_id)
 
     async def discovery_loop(self) -> None:
         """Main discovery loop - runs at configured interval."""
         interval = self.registry.get_probe_interval()
+        loop = asyncio.get_running_loop()
+        # Fixed cadence on the loop's monotonic clock: scan time comes out
+        # of the sleep instead of pushing the next cycle back
+        next_tick = loop.time()
 
         while True:
+            next_tick += interval
             try:
-                peer_names = [h.name for h in self.registry.get_peer_hosts()]
                 logger.info(
                     "AINLP.dendritic: Discovery cycle (peers: %s)...",
-                    peer_names
+                    self._peer_names
                 )
 
+                self._cycle += 1
                 peers = await self.discover_peers()
 
                 if peers:
+                    peers.extend(await self._gossip(peers))
                     logger.info(
                         "AINLP.dendritic: Found %d peer(s)", len(peers)
                     )
@@ -727,24 +1367,48 @@ aios_cell_up{{cell_id="{cell_id}"}} 1
 
                     for peer in peers:
                         self.peers[peer.cell_id] = peer
+                        self._heard[peer.cell_id] = self._cycle
+                    self._peers_body = None
                 else:
                     logger.info("AINLP.dendritic: No peers this cycle")
 
+                self._evict_silent()
+                await self._save_peer_cache()
+
             except Exception as exc:
                 logger.error("AINLP.dendritic: Discovery error: %s", exc)
 
-            await asyncio.sleep(interval)
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Overran a whole cycle; re-anchor rather than burst
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
 
     async def start_services(self) -> None:
         """Start both the API server and discovery loop."""
         discovery_task = asyncio.create_task(self.discovery_loop())
+        mcast = await self._start_multicast_responder()
+        try:
+            await self._serve(discovery_task)
+        finally:
+            if mcast is not None:
+                mcast.close()
+
+    async def _serve(self, discovery_task: asyncio.Task) -> None:
+        """Run the API server (or headless) until shutdown."""
+        if FASTAPI_AVAILABLE and UVICORN_AVAILABLE:
+            # pylint: disable-next=import-outside-toplevel,import-error
+            import uvicorn  # type: ignore
 
-        if FASTAPI_AVAILABLE and UVICORN_AVAILABLE and uvicorn is not None:
             config = uvicorn.Config(
                 self.app,
                 host="0.0.0.0",
                 port=self.listen_port,
-                log_level="info"
+                log_level="info",
+                # uvicorn's 5 s default drops peers' pooled connections
+                # between 30 s cycles
+                timeout_keep_alive=self._keepalive_s
             )
             server = uvicorn.Server(config)
 
@@ -766,8 +1430,12 @@ aios_cell_up{{cell_id="{cell_id}"}} 1
                     await discovery_task
                 except asyncio.CancelledError:
                     pass
+                await self.close_session()
         else:
-            await self._run_headless(discovery_task)
+            try:
+                await self._run_headless(discovery_task)
+            finally:
+                await self.close_session()
 
     async def _run_headless(self, discovery_task: asyncio.Task) -> None:
         """AINLP.dendritic: Run headless when frameworks unavailable."""
@@ -800,7 +1468,14 @@ def main() -> None:
     logger.info("AIOS Discovery Service - AINLP.dendritic(AIOS{growth})")
     logger.info("=" * 60)
 
-    asyncio.run(discovery.start_services())
+    if UVLOOP_AVAILABLE:
+        # libuv event loop for the probe/gossip fan-out and uvicorn alike;
+        # uvloop.run replaces the deprecated uvloop.install() policy swap
+        import uvloop  # type: ignore  # pylint: disable=import-outside-toplevel
+        logger.info("AINLP.dendritic: uvloop event loop")
+        uvloop.run(discovery.start_services())
+    else:
+        asyncio.run(discovery.start_services())
 
 
 if __name__ == "__main__":
@@ -7,11 +7,18 @@ Common dendritic growth patterns and framework detection utilities
 from .dendritic_utils import (
     DendriticFrameworkDetector,
     create_fallback_app,
-    get_base_model
+    get_base_model,
+    json_body
 )
+from .profiling import install_profiler
+from .queued_logging import LazyJson, install_queue_logging
 
 __all__ = [
     'DendriticFrameworkDetector',
+    'LazyJson',
     'create_fallback_app',
-    'get_base_model'
+    'get_base_model',
+    'install_profiler',
+    'install_queue_logging',
+    'json_body'
 ]
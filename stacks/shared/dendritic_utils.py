@@ -11,6 +11,7 @@ Provides:
 - Graceful fallback patterns when dependencies unavailable
 """
 
+import functools
 import importlib.util
 import logging
 import os
@@ -30,26 +31,28 @@ except ImportError:
     PYDANTIC_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=None)
+def _spec_available(framework_name: str) -> bool:
+    """
+    Process-wide module presence check.
+
+    find_spec only consults the import finders; the module itself is not
+    executed, so probing 'fastapi' does not pay FastAPI's import cost.
+    Cached across every detector instance in the process.
+    """
+    try:
+        return importlib.util.find_spec(framework_name) is not None
+    except (ModuleNotFoundError, ValueError, ImportError) as exc:
+        logger.debug("Framework %s unavailable: %s", framework_name, exc)
+        return False
+
+
 class DendriticFrameworkDetector:
     """AINLP.dendritic growth: Centralized framework availability detection"""
 
-    def __init__(self) -> None:
-        self._cache: Dict[str, bool] = {}
-
     def is_available(self, framework_name: str) -> bool:
         """Check if a framework is available using enhanced dendritic logic"""
-        if framework_name in self._cache:
-            return self._cache[framework_name]
-
-        try:
-            spec = importlib.util.find_spec(framework_name)
-            available = spec is not None
-            self._cache[framework_name] = available
-            return available
-        except (ModuleNotFoundError, ValueError, ImportError) as exc:
-            logger.debug("Framework %s unavailable: %s", framework_name, exc)
-            self._cache[framework_name] = False
-            return False
+        return _spec_available(framework_name)
 
     def get_available_frameworks(self, frameworks: list) -> Dict[str, bool]:
         """Check availability of multiple frameworks"""
@@ -83,6 +86,30 @@ def get_base_model() -> Type:
     return FallbackBaseModel
 
 
+def json_body(model: Type) -> Any:
+    """
+    AINLP.dendritic: FastAPI dependency validating the raw request body.
+
+    pydantic-core (v2) parses the bytes straight into `model`, skipping
+    the intermediate json.loads dict FastAPI builds for BaseModel
+    parameters. Errors surface as the usual 422 with body-prefixed
+    locations. Use as `param: Model = Depends(json_body(Model))`.
+    """
+    from fastapi import Request
+    from fastapi.exceptions import RequestValidationError
+    from pydantic import ValidationError
+
+    async def _decode(request: Request) -> Any:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**err, "loc": ("body", *err["loc"])}
+                for err in e.errors(include_url=False)
+            ]) from e
+    return _decode
+
+
 # =============================================================================
 # OS DISTILLATION FOR CELL POPULATIONS
 # =============================================================================
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+AIOS Shared Request Profiling
+Opt-in cProfile capture for the ASGI cell servers
+
+AINLP.dendritic[shared]{profiling,diagnostics}
+
+Enabled with AIOS_PROFILE=1; production paths carry no instrumentation
+otherwise. Each profiled request is dumped to AIOS_PROFILE_DIR (default
+./prof) as a .prof file, and the top AIOS_PROFILE_RESTRICT entries
+(default 30) by cumulative time are logged.
+
+For whole-process sampling without touching the app, use py-spy:
+    py-spy record -o flame.svg -- python cell_server_alpha.py
+    py-spy top --pid <uvicorn pid>
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware profiling one HTTP request at a time.
+
+    cProfile allows a single active profiler per thread, so requests that
+    arrive while another is being profiled pass through unprofiled.
+    """
+
+    def __init__(self, app: Any, profile_dir: str = "./prof",
+                 restrictions: int = 30) -> None:
+        self.app = app
+        self.profile_dir = Path(profile_dir)
+        self.restrictions = restrictions
+        self._active = False
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or self._active:
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._active = False
+            self._dump(profiler, scope, time.perf_counter() - start)
+
+    def _dump(self, profiler: cProfile.Profile, scope: dict,
+              elapsed: float) -> None:
+        path = scope.get("path", "/").strip("/").replace("/", ".") or "root"
+        name = "%s.%s.%dms.%d.prof" % (
+            scope.get("method", "GET"), path, elapsed * 1000, time.time()
+        )
+        profiler.dump_stats(str(self.profile_dir / name))
+
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats("cumulative").print_stats(self.restrictions)
+        logger.info("AINLP.dendritic: Profile %s\n%s", name, out.getvalue())
+
+
+def install_profiler(app: Any) -> bool:
+    """
+    Wrap a FastAPI/Starlette app with ProfilerMiddleware when
+    AIOS_PROFILE=1. Returns True if the profiler was installed.
+    """
+    if os.getenv("AIOS_PROFILE") != "1":
+        return False
+    app.add_middleware(
+        ProfilerMiddleware,
+        profile_dir=os.getenv("AIOS_PROFILE_DIR", "./prof"),
+        restrictions=int(os.getenv("AIOS_PROFILE_RESTRICT", "30"))
+    )
+    logger.warning("AINLP.dendritic: Request profiling enabled")
+    return True
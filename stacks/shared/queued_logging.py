@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+AIOS Shared Queued Logging
+Moves log handler I/O off the request path
+
+AINLP.dendritic[shared]{logging,backpressure}
+
+Request handlers only enqueue log records; a single listener thread
+formats them and performs the stream writes. Under overload the oldest
+queued records are dropped instead of blocking producers. Structured
+payloads wrapped in LazyJson are serialized by the listener as well.
+"""
+
+import atexit
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_listener: Optional[QueueListener] = None
+
+
+class LazyJson:
+    """
+    Log argument that serializes its payload only when formatted.
+
+    Pass as a %s argument: with queue logging installed the encoding runs
+    on the listener thread, and not at all if the record is filtered out.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: Any) -> None:
+        self.payload = payload
+
+    def __str__(self) -> str:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.payload, default=str).decode()
+        return json.dumps(self.payload, default=str)
+
+
+class DropOldestQueueHandler(QueueHandler):
+    """QueueHandler that evicts the oldest record instead of blocking"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # In-process queue: leave message formatting to the listener
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room instead of failing"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+def install_queue_logging(maxsize: int = 10000) -> QueueListener:
+    """
+    Route root logging through a bounded queue drained by one thread.
+
+    The root logger's current handlers move behind a QueueListener.
+    Safe to call more than once; later calls return the running listener.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=maxsize)
+    root.handlers = [DropOldestQueueHandler(log_queue)]
+
+    _listener = _DrainingQueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
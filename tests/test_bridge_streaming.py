@@ -0,0 +1,228 @@
+"""
+AINLP.dendritic: VSCode bridge streaming relay and adaptive limiter.
+
+Covers the "source" splice of streamed /code-assist bodies, limiter slot
+release (success, failure, acquire timeout) and the end-to-end relay
+against a live aiohttp upstream.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+
+from stacks.cells.bridge import bridge  # noqa: E402
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _splice(head: bytes, *parts: bytes) -> bytes:
+    return b"".join(
+        [piece async for piece in bridge._splice_source(head, _chunks(*parts))]
+    )
+
+
+# =============================================================================
+# _splice_source
+# =============================================================================
+
+def test_splice_appends_source_as_last_key():
+    body = asyncio.run(_splice(b'{"a": 1', b', "b": [2, 3]', b"}\n"))
+    assert json.loads(body) == {"a": 1, "b": [2, 3], "source": "desktop_cell"}
+    assert body.endswith(b'"source":"desktop_cell"}')
+
+
+def test_splice_overrides_upstream_source():
+    body = asyncio.run(_splice(b'{"source": "upstream", "x": 1}'))
+    # Duplicate key, placed last: last-wins parsers see the bridge's value
+    assert json.loads(body)["source"] == "desktop_cell"
+
+
+def test_splice_holds_back_across_blank_chunks():
+    body = asyncio.run(_splice(b"{", b'"a": 1', b"}", b"  ", b"\n"))
+    assert json.loads(body) == {"a": 1, "source": "desktop_cell"}
+
+
+def test_splice_empty_object():
+    body = asyncio.run(_splice(b"{", b" }"))
+    assert json.loads(body) == {"source": "desktop_cell"}
+
+
+def test_splice_passes_truncated_body_through():
+    body = asyncio.run(_splice(b'{"a": ', b"1"))
+    assert body == b'{"a": 1'
+
+
+# =============================================================================
+# AdaptiveLimiter
+# =============================================================================
+
+def test_limiter_releases_slot_and_grows_on_success():
+    async def run():
+        limiter = bridge.AdaptiveLimiter(initial=2, maximum=4)
+        async with limiter.slot():
+            assert limiter._in_flight == 1
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter._in_flight == 0
+    assert limiter._window == pytest.approx(2.5)
+
+
+@pytest.mark.parametrize("error", [
+    asyncio.TimeoutError(),
+    aiohttp.ServerDisconnectedError(),
+    aiohttp.ClientConnectionError("refused"),
+])
+def test_limiter_halves_window_on_upstream_failure(error):
+    async def run():
+        limiter = bridge.AdaptiveLimiter(initial=8, maximum=64)
+        with pytest.raises(type(error)):
+            async with limiter.slot():
+                raise error
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter._in_flight == 0
+    assert limiter.limit == 4
+
+
+def test_limiter_acquire_timeout_leaves_no_slot_behind():
+    async def run():
+        limiter = bridge.AdaptiveLimiter(
+            initial=1, minimum=1, maximum=1, acquire_timeout=0.05
+        )
+        async with limiter.slot():
+            with pytest.raises(asyncio.TimeoutError):
+                async with limiter.slot():
+                    pass  # pragma: no cover
+        # The holder's release is unaffected by the waiter timing out
+        async with limiter.slot():
+            pass
+        assert limiter._in_flight == 0
+
+    asyncio.run(run())
+
+
+# =============================================================================
+# Streaming relay (_stream_code_assist)
+# =============================================================================
+
+requires_fastapi = pytest.mark.skipif(
+    not bridge.FASTAPI_AVAILABLE, reason="streaming relay needs FastAPI"
+)
+
+
+async def _serve(body: bytes, status: int = 200):
+    """Upstream desktop cell answering /code-assist with `body`."""
+    async def code_assist(_request):
+        response = web.StreamResponse(status=status)
+        response.content_type = "application/json"
+        await response.prepare(_request)
+        # Several writes, so the relay sees more than one chunk
+        for i in range(0, len(body), 7):
+            await response.write(body[i:i + 7])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/code-assist", code_assist)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class _ClientGone(Exception):
+    """Raised by the ASGI send of a client that went away."""
+
+
+async def _asgi(response, fail_send: bool = False) -> bytes:
+    """Drive a Starlette response as the server would; returns the body."""
+    body = []
+
+    async def receive():
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}  # pragma: no cover
+
+    async def send(message):
+        if fail_send:
+            raise _ClientGone()
+        body.append(message.get("body", b""))
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    await response(scope, receive, send)
+    return b"".join(body)
+
+
+def _bridge(url: str):
+    b = bridge.VSCodeBridge()
+    b._desktop_assist_url = f"{url}/code-assist"
+    return b
+
+
+@requires_fastapi
+def test_stream_relays_body_and_releases_slot():
+    upstream = json.dumps({"suggestion": "x" * 200, "score": 1}).encode()
+
+    async def run():
+        runner, url = await _serve(b"  " + upstream)
+        b = _bridge(url)
+        try:
+            response = await b._stream_code_assist({"code": "pass"})
+            assert response is not None
+            assert b._limiter._in_flight == 1  # Held while streaming
+            body = await _asgi(response)
+            # Checked inside the loop: asyncio.run's shutdown would close
+            # a leaked slot generator and hide the leak
+            assert b._limiter._in_flight == 0
+            return body
+        finally:
+            await b.close_session()
+            await runner.cleanup()
+
+    body = asyncio.run(run())
+    assert json.loads(body) == {
+        **json.loads(upstream), "source": "desktop_cell"
+    }
+
+
+@requires_fastapi
+def test_stream_releases_slot_when_client_disconnects():
+    async def run():
+        runner, url = await _serve(b'{"a": 1}')
+        b = _bridge(url)
+        try:
+            response = await b._stream_code_assist({"code": "pass"})
+            with pytest.raises(_ClientGone):
+                await _asgi(response, fail_send=True)
+            assert b._limiter._in_flight == 0
+        finally:
+            await b.close_session()
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+@requires_fastapi
+@pytest.mark.parametrize("status, body", [(503, b'{"error": 1}'), (200, b"[1]")])
+def test_stream_declines_non_object_or_error(status, body):
+    async def run():
+        runner, url = await _serve(body, status)
+        b = _bridge(url)
+        try:
+            assert await b._stream_code_assist({"code": "pass"}) is None
+            assert b._limiter._in_flight == 0
+        finally:
+            await b.close_session()
+            await runner.cleanup()
+
+    asyncio.run(run())
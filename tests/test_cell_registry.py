@@ -0,0 +1,112 @@
+"""
+AINLP.dendritic: cell_birth registry journal, compaction and lock.
+
+The Docker client is never used by these paths; it is replaced so the
+tests do not need a running dockerd.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("docker")
+pytest.importorskip("requests")
+
+from stacks.cells import cell_birth  # noqa: E402
+
+
+@pytest.fixture
+def birther(tmp_path, monkeypatch):
+    monkeypatch.setattr(cell_birth.docker, "from_env", lambda **_: None)
+    return cell_birth.CellBirther(tmp_path)
+
+
+def _reload(birther):
+    return cell_birth.CellBirther(birther.workspace_root)._load_registry()
+
+
+def test_mutations_are_journaled_and_replayed(birther):
+    birther._mutate_registry(
+        lambda r: r["cells"].update(alpha={"port": 8001, "status": "birthing"})
+    )
+    birther._mutate_registry(lambda r: r.update(next_port=8002))
+
+    assert not birther.registry_file.exists()  # No snapshot until compaction
+    assert len(birther.journal_file.read_bytes().splitlines()) == 2
+    assert _reload(birther) == {
+        "cells": {"alpha": {"port": 8001, "status": "birthing"}},
+        "next_port": 8002,
+    }
+
+
+def test_in_place_cell_edit_is_journaled(birther):
+    birther._mutate_registry(
+        lambda r: r["cells"].update(alpha={"port": 8001, "status": "birthing"})
+    )
+    birther._mutate_registry(lambda r: r["cells"]["alpha"].update(status="healthy"))
+
+    assert _reload(birther)["cells"]["alpha"]["status"] == "healthy"
+
+
+def test_removal_and_noop_mutations(birther):
+    birther._mutate_registry(lambda r: r["cells"].update(alpha={"port": 1}))
+    birther._mutate_registry(lambda r: None)  # Nothing changed: no record
+    birther._mutate_registry(lambda r: r["cells"].pop("alpha"))
+
+    assert len(birther.journal_file.read_bytes().splitlines()) == 2
+    assert _reload(birther)["cells"] == {}
+
+
+def test_torn_journal_tail_is_ignored(birther):
+    birther._mutate_registry(lambda r: r["cells"].update(alpha={"port": 1}))
+    with open(birther.journal_file, "ab") as f:
+        f.write(b'{"cells": {"beta": {"po')
+
+    assert _reload(birther)["cells"] == {"alpha": {"port": 1}}
+
+
+def test_compaction_folds_journal_into_snapshot(birther, monkeypatch):
+    monkeypatch.setattr(cell_birth, "JOURNAL_COMPACT_BYTES", 200)
+    for i in range(10):
+        birther._mutate_registry(
+            lambda r, i=i: r["cells"].update({"cell-%02d" % i: {"port": i}})
+        )
+
+    assert birther.registry_file.exists()
+    journal = birther.journal_file
+    assert not journal.exists() or journal.stat().st_size <= 200
+    registry = _reload(birther)
+    assert registry["cells"] == {"cell-%02d" % i: {"port": i} for i in range(10)}
+    assert registry["next_port"] == 8001
+
+
+def test_dead_holder_lock_is_broken(birther):
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    birther.lock_file.parent.mkdir(parents=True, exist_ok=True)
+    birther.lock_file.write_text(str(proc.pid))
+
+    with birther._registry_lock():
+        assert birther.lock_file.read_text() == str(os.getpid())
+    assert not birther.lock_file.exists()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="liveness check is POSIX-only")
+def test_live_holder_lock_is_never_broken(birther, monkeypatch):
+    monkeypatch.setattr(cell_birth, "REGISTRY_LOCK_TIMEOUT", 0.3)
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        birther.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        birther.lock_file.write_text(str(proc.pid))
+        # Older than the timeout, but its holder is alive
+        os.utime(birther.lock_file, (0, 0))
+
+        with pytest.raises(TimeoutError):
+            with birther._registry_lock():
+                pass  # pragma: no cover
+        assert birther.lock_file.read_text() == str(proc.pid)
+    finally:
+        proc.kill()
+        proc.wait()
@@ -0,0 +1,97 @@
+"""
+AINLP.dendritic: Discovery peer cache persistence and silent-peer eviction.
+"""
+
+import asyncio
+
+import pytest
+
+from stacks.cells.discovery import discovery
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        discovery, "PEER_CACHE_PATH", str(tmp_path / "peers-{cell_id}-{port}.json")
+    )
+    return tmp_path
+
+
+def _peer(cell_id: str, ip: str = "192.168.1.50", port: int = 8001):
+    return discovery.CellInfo(cell_id=cell_id, ip=ip, port=port)
+
+
+def _learn(service, peer):
+    service.peers[peer.cell_id] = peer
+    service._heard[peer.cell_id] = service._cycle
+    service._last_seen["%s:%s" % (peer.ip, peer.port)] = (1.0, peer.cell_id)
+
+
+def test_cache_round_trip(cache_path):
+    service = discovery.AIOSDiscovery("desktop", 8001)
+    _learn(service, _peer("laptop"))
+    asyncio.run(service._save_peer_cache())
+
+    restored = discovery.AIOSDiscovery("desktop", 8001)
+    assert list(restored.peers) == ["laptop"]
+    assert restored.peers["laptop"].ip == "192.168.1.50"
+    assert restored._last_seen == {"192.168.1.50:8001": (1.0, "laptop")}
+
+
+def test_cache_is_per_instance(cache_path):
+    service = discovery.AIOSDiscovery("desktop", 8001)
+    _learn(service, _peer("laptop"))
+    asyncio.run(service._save_peer_cache())
+
+    assert discovery.AIOSDiscovery("desktop", 8002).peers == {}
+    assert discovery.AIOSDiscovery("other", 8001).peers == {}
+    assert (cache_path / "peers-desktop-8001.json").exists()
+
+
+def test_unchanged_cache_is_not_rewritten(cache_path, monkeypatch):
+    service = discovery.AIOSDiscovery("desktop", 8001)
+    _learn(service, _peer("laptop"))
+    writes = []
+    write = service._write_peer_cache
+    monkeypatch.setattr(
+        service, "_write_peer_cache", lambda body: (writes.append(body), write(body))
+    )
+
+    asyncio.run(service._save_peer_cache())
+    asyncio.run(service._save_peer_cache())
+    assert len(writes) == 1
+
+    # A restart with the same view does not rewrite it either
+    restored = discovery.AIOSDiscovery("desktop", 8001)
+    monkeypatch.setattr(restored, "_write_peer_cache", writes.append)
+    asyncio.run(restored._save_peer_cache())
+    assert len(writes) == 1
+
+
+def test_corrupt_cache_is_ignored(cache_path):
+    (cache_path / "peers-desktop-8001.json").write_text("{not json")
+    assert discovery.AIOSDiscovery("desktop", 8001).peers == {}
+
+
+def test_silent_peer_is_evicted_and_dropped_from_cache(cache_path):
+    service = discovery.AIOSDiscovery("desktop", 8001)
+    _learn(service, _peer("laptop"))
+    _learn(service, _peer("phone", ip="192.168.1.60"))
+    asyncio.run(service._save_peer_cache())
+
+    for _ in range(discovery.GOSSIP_EVICT_CYCLES):
+        service._cycle += 1
+        service._heard["phone"] = service._cycle  # Still heard from
+        service._evict_silent()
+    assert set(service.peers) == {"laptop", "phone"}
+
+    service._cycle += 1
+    service._heard["phone"] = service._cycle
+    service._evict_silent()
+    assert set(service.peers) == {"phone"}
+    assert "192.168.1.50:8001" not in service._last_seen
+
+    asyncio.run(service._save_peer_cache())
+    restored = discovery.AIOSDiscovery("desktop", 8001)
+    assert set(restored.peers) == {"phone"}
+    assert set(restored._last_seen) == {"192.168.1.60:8001"}
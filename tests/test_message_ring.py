@@ -0,0 +1,64 @@
+"""
+AINLP.dendritic: Cell Alpha message ring wraparound and archival drain.
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("uvicorn")
+
+from stacks.cells.alpha.cell_server_alpha import MessageRing  # noqa: E402
+
+
+def _fill(ring: MessageRing, senders):
+    for i, sender in enumerate(senders):
+        ring.append(sender, "m%d" % i, "general", "normal", {}, i * 10**9)
+
+
+def test_recent_after_wraparound_keeps_newest_in_order():
+    ring = MessageRing(4)
+    _fill(ring, ["a", "b", "a", "b", "a", "c"])
+
+    messages, total = ring.recent(limit=10)
+    assert total == len(ring) == 4
+    assert [m["content"] for m in messages] == ["m2", "m3", "m4", "m5"]
+
+    messages, total = ring.recent(limit=2)
+    assert total == 4
+    assert [m["content"] for m in messages] == ["m4", "m5"]
+
+
+def test_sender_index_drops_evicted_messages():
+    ring = MessageRing(3)
+    _fill(ring, ["a", "b", "a", "b", "b"])
+
+    messages, total = ring.recent(limit=10, from_cell="a")
+    assert total == 1
+    assert [m["content"] for m in messages] == ["m2"]
+    assert ring.recent(limit=10, from_cell="b")[1] == 2
+    # A sender whose every message was evicted leaves no index behind
+    _fill(ring, ["c", "c", "c"])
+    assert ring.recent(limit=10, from_cell="a") == ([], 0)
+    assert set(ring._by_sender) == {"c"}
+
+
+def test_drain_returns_each_message_once():
+    ring = MessageRing(4)
+    _fill(ring, ["a", "b"])
+    assert [m["content"] for m in ring.drain()] == ["m0", "m1"]
+    assert ring.drain() == []
+
+    ring.append("c", "m2", "general", "normal", {}, 0)
+    assert [m["content"] for m in ring.drain()] == ["m2"]
+    assert ring.dropped == 0
+
+
+def test_drain_counts_messages_lapped_by_producers():
+    ring = MessageRing(4)
+    _fill(ring, "abcdefghij")  # 10 messages, 4 retained
+
+    drained = ring.drain()
+    assert [m["content"] for m in drained] == ["m6", "m7", "m8", "m9"]
+    assert ring.dropped == 6
+    assert ring.drain() == []